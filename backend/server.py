@@ -26,7 +26,7 @@ from services.position_manager import PositionManager
 from services.metrics_service import MetricsService
 from services.bot_manager import BotManager
 from services.telegram_service import TelegramService
-from services.wallet_service import WalletService
+from services.wallet_service import WalletService, is_cryptojs_encrypted, decrypt_cryptojs_aes
 from services.solana_trader import SolanaTrader
 from services.liquidity_monitor import LiquidityMonitorService
 
@@ -67,7 +67,7 @@ bot_manager = BotManager(
 )
 bot_manager.solana_trader = solana_trader
 bot_manager.liquidity_monitor = liquidity_monitor
-telegram_service = TelegramService(bot_manager, db)
+telegram_service = TelegramService(bot_manager, db, http_session=solana_trader.get_http_session)
 
 # --- WebSocket Manager ---
 ws_clients: List[WebSocket] = []
@@ -140,7 +140,6 @@ async def encrypt_wallet(body: WalletSetup):
     if not body.private_key or not body.passphrase:
         return {"error": "private_key and passphrase required"}
     try:
-        from services.wallet_service import is_cryptojs_encrypted, decrypt_cryptojs_aes
         input_key = body.private_key.strip()
         raw_solana_key = input_key
 
@@ -492,4 +491,6 @@ async def shutdown():
     if bot_manager.status == "running":
         await bot_manager.stop()
     await telegram_service.stop()
+    await solana_trader.close()
+    await wallet_service.close()
     client.close()
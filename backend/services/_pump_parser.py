@@ -0,0 +1,139 @@
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+# Pure dict/list walking over getTransaction results, with no solders/aiohttp imports,
+# so this module can be compiled as-is with `mypyc services/_pump_parser.py`.
+# The compiled extension shadows the .py automatically; callers import it the same way.
+
+logger = logging.getLogger("solana_trader")
+
+TOKEN_PROGRAM_STR = "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA"
+TOKEN_2022_PROGRAM_STR = "TokenzQdBNbLqP5VEhdkAS6EPFLC1PHnBqCXEpPxuEb"
+PUMP_FUN_PROGRAM_STR = "6EF8rrecthR5Dkzon8Nwu78hRvfCKubJ14M5uBEwF6P"
+
+ParseResult = Tuple[Optional[Dict[str, Any]], Optional[str]]
+
+
+def find_pump_ix(instructions: Any) -> Optional[Dict[str, Any]]:
+    for ix in instructions:
+        if ix.get("programId") == PUMP_FUN_PROGRAM_STR:
+            return ix
+    return None
+
+
+def extract_pump_accounts(tx_data: Dict[str, Any]) -> ParseResult:
+    try:
+        meta = tx_data.get("meta")
+        if meta is None:
+            return None, "tx_meta_null"
+        if meta.get("err"):
+            return None, "tx_meta_err"
+
+        tx_msg = tx_data.get("transaction", {}).get("message", {})
+        account_keys = tx_msg.get("accountKeys", [])
+        if not account_keys:
+            return None, "no_account_keys"
+
+        # One pass over accountKeys: (pubkey, is_signer, is_writable) per position.
+        # A response is either all jsonParsed dicts or all plain strings, so pick the shape once.
+        parsed_keys: List[Tuple[str, bool, bool]]
+        if isinstance(account_keys[0], dict):
+            parsed_keys = [
+                (ak.get("pubkey", ""), ak.get("signer", False), ak.get("writable", False))
+                for ak in account_keys
+            ]
+        else:
+            parsed_keys = [(str(ak), False, False) for ak in account_keys]
+        keys_list = [k[0] for k in parsed_keys]
+
+        logs = meta.get("logMessages", [])
+        if not any("Instruction: Create" in line or "InitializeMint" in line for line in logs):
+            return None, "no_create_discriminator"
+
+        # Detect which token program is used in this transaction
+        token_program_str = TOKEN_2022_PROGRAM_STR  # default to Token-2022
+        if TOKEN_PROGRAM_STR in keys_list and TOKEN_2022_PROGRAM_STR not in keys_list:
+            token_program_str = TOKEN_PROGRAM_STR
+
+        pump_ix = find_pump_ix(tx_msg.get("instructions", ()))
+        if not pump_ix:
+            # First pump ix of the last inner group that has one, as the original nested loop picked
+            for group in meta.get("innerInstructions", ()):
+                pump_ix = find_pump_ix(group.get("instructions", ())) or pump_ix
+
+        if not pump_ix:
+            return None, "no_pump_instruction"
+
+        ix_accounts = pump_ix.get("accounts", [])
+        post_balances = meta.get("postTokenBalances", [])
+        if not post_balances:
+            return None, "no_post_token_balances"
+
+        # Curve accounts come from fixed instruction slots; too short a layout can never parse
+        if len(ix_accounts) < 5:
+            return None, "missing_accounts"
+        bonding_curve = ix_accounts[3]
+        assoc_bonding_curve = ix_accounts[4]
+        mint = next(
+            (ptb["mint"] for ptb in post_balances if ptb.get("mint") and ptb.get("owner")),
+            None
+        ) or ix_accounts[2]
+
+        if mint and bonding_curve:
+            # Extract creator from tx signers (first signer that isn't the mint)
+            creator = next((k for k, is_signer, _ in parsed_keys if is_signer and k != mint), None)
+
+            logger.info(
+                "Extracted: mint=%.12s... creator=%.12s... tp=%s", mint, creator,
+                "T22" if token_program_str == TOKEN_2022_PROGRAM_STR else "SPL"
+            )
+
+            # Build complete account metas list for cloning
+            key_flags: Dict[str, Tuple[bool, bool]] = {}
+            for k, is_signer, is_writable in parsed_keys:
+                key_flags.setdefault(k, (is_signer, is_writable))
+
+            account_metas_for_clone: List[Dict[str, Any]] = []
+            for idx in ix_accounts:
+                pubkey_str = ""
+                is_signer = False
+                is_writable = False
+
+                if isinstance(idx, int):
+                    if idx < len(parsed_keys):
+                        pubkey_str, is_signer, is_writable = parsed_keys[idx]
+                elif isinstance(idx, dict):
+                    pubkey_str = idx.get("pubkey", "")
+                    is_signer = idx.get("signer", False)
+                    is_writable = idx.get("writable", False)
+                else:
+                    pubkey_str = str(idx)
+                    is_signer, is_writable = key_flags.get(pubkey_str, (False, False))
+
+                if pubkey_str:
+                    account_metas_for_clone.append({
+                        "pubkey": pubkey_str,
+                        "isSigner": is_signer,
+                        "isWritable": is_writable
+                    })
+
+            if not account_metas_for_clone:
+                return None, "clone_accounts_empty"
+
+            return {
+                "mint": mint,
+                "bonding_curve": bonding_curve,
+                "associated_bonding_curve": assoc_bonding_curve or "",
+                "token_program": token_program_str,
+                "creator": creator,
+                "accounts": ix_accounts,
+                "all_keys": keys_list,
+                "instruction_data": pump_ix.get("data", ""),
+                "account_metas_clone": account_metas_for_clone,
+            }, None
+        return None, "missing_accounts"
+
+    except Exception as e:
+        # Drop silently - exceptions during extraction are common in HFT
+        logger.debug("_extract_pump_accounts failed: %s", e)
+        return None, "extract_exception"
@@ -49,6 +49,7 @@ class BotManager:
         else:
             if self.solana_trader:
                 self.solana_trader.load_keypair_from_wallet()
+                self.solana_trader.start_blockhash_refresher()
             if self.liquidity_monitor:
                 self.liquidity_monitor.on_candidate = self._on_live_candidate
                 await self.liquidity_monitor.start()
@@ -65,6 +66,8 @@ class BotManager:
         for task in self._tasks:
             task.cancel()
         self._tasks.clear()
+        if self.solana_trader:
+            self.solana_trader.stop_blockhash_refresher()
         if self.liquidity_monitor:
             await self.liquidity_monitor.stop()
         await self.log("INFO", "bot_manager", "Bot stopped")
@@ -264,18 +267,18 @@ class BotManager:
 
                     eval_result = await self.strategy_engine.evaluate(parsed, simulation=True)
 
-                    if not eval_result["passed"]:
-                        await self.log("INFO", "strategy", f"REJECTED {parsed.token_name}: {eval_result['reason']}")
+                    if not eval_result.passed:
+                        await self.log("INFO", "strategy", f"REJECTED {parsed.token_name}: {eval_result.reason}")
                         self.metrics.increment("strategy_rejected")
                         continue
 
                     await self.log("TRADE", "strategy",
-                                   f"APPROVED {parsed.token_name} score={eval_result['pump_score']} buy={eval_result['buy_amount_sol']} SOL")
+                                   f"APPROVED {parsed.token_name} score={eval_result.pump_score} buy={eval_result.buy_amount_sol} SOL")
                     self.metrics.increment("strategy_approved")
 
                     start_exec = time.time()
                     exec_result = await self.execution_engine.execute_clone_and_inject(
-                        parsed, eval_result["buy_amount_sol"], simulation=True
+                        parsed, eval_result.buy_amount_sol, simulation=True
                     )
                     exec_ms = (time.time() - start_exec) * 1000
                     self.metrics.record_latency("execution_latency_ms", exec_ms)
@@ -284,7 +287,7 @@ class BotManager:
                     if exec_result["success"]:
                         pos_id = await self.position_manager.register_buy(
                             parsed.mint, parsed.token_name, exec_result["entry_price_sol"],
-                            eval_result["buy_amount_sol"], eval_result["pump_score"],
+                            eval_result.buy_amount_sol, eval_result.pump_score,
                             exec_result["signature"]
                         )
                         if pos_id:
@@ -1,15 +1,16 @@
 import os
-import json
 import time
 import asyncio
 import logging
 import aiohttp
+import orjson
 from typing import Optional, Set, Callable
 from collections import OrderedDict
 
 logger = logging.getLogger("liquidity_monitor")
 
 PUMP_FUN_PROGRAM = "6EF8rrecthR5Dkzon8Nwu78hRvfCKubJ14M5uBEwF6P"
+_JSON_HEADERS = {"Content-Type": "application/json"}
 
 
 class LRUDedup:
@@ -114,8 +115,9 @@ class LiquidityMonitorService:
         }
         try:
             async with aiohttp.ClientSession() as session:
-                async with session.post(url, json=payload, timeout=aiohttp.ClientTimeout(total=6)) as resp:
-                    data = await resp.json()
+                async with session.post(url, data=orjson.dumps(payload), headers=_JSON_HEADERS,
+                                        timeout=aiohttp.ClientTimeout(total=6)) as resp:
+                    data = orjson.loads(await resp.read())
                     if "error" in data:
                         err_code = data["error"].get("code", 0) if isinstance(data["error"], dict) else 0
                         if err_code == -32401:
@@ -170,9 +172,9 @@ class LiquidityMonitorService:
                                 break
                             if msg.type == aiohttp.WSMsgType.TEXT:
                                 try:
-                                    data = json.loads(msg.data)
+                                    data = orjson.loads(msg.data)
                                     await self._handle_log_message(data, source_id)
-                                except json.JSONDecodeError:
+                                except orjson.JSONDecodeError:
                                     pass
                             elif msg.type in (aiohttp.WSMsgType.ERROR, aiohttp.WSMsgType.CLOSED):
                                 break
@@ -1,9 +1,21 @@
 import time
+import heapq
 import logging
 from typing import Dict, List, Optional
 
 logger = logging.getLogger("rpc_manager")
 
+# Circuit breaker: this many consecutive transport/5xx/429 failures open the endpoint for
+# CIRCUIT_RECOVERY_SEC; after that a single half-open probe goes out, and everything else
+# stays off the endpoint until it reports back (or CIRCUIT_PROBE_LEASE_SEC passes without word).
+CIRCUIT_FAILURE_THRESHOLD = 3
+CIRCUIT_RECOVERY_SEC = 10.0
+CIRCUIT_PROBE_LEASE_SEC = 10.0
+
+
+class CircuitOpen(Exception):
+    """Raised instead of calling an endpoint whose circuit is open; callers skip to the next one."""
+
 
 class RpcEndpoint:
     def __init__(self, url: str, wss: str = None, pool: str = "fast", role: str = "general"):
@@ -17,15 +29,42 @@ class RpcEndpoint:
         self.cooldown_until = 0.0
         self.health_score = 100.0
         self.last_check = 0.0
+        self.consecutive_failures = 0
+        self.probe_until = 0.0
 
     def is_available(self):
-        return time.time() > self.cooldown_until
+        now = time.time()
+        return now > self.cooldown_until and now > self.probe_until
+
+    def admit(self) -> bool:
+        """Whether a call may go out now; past recovery, the first caller becomes the half-open probe."""
+        if self.consecutive_failures < CIRCUIT_FAILURE_THRESHOLD:
+            return True
+        now = time.time()
+        if now <= self.cooldown_until or now <= self.probe_until:
+            return False
+        self.probe_until = now + CIRCUIT_PROBE_LEASE_SEC
+        return True
 
     def mark_429(self):
         self.recent_429s += 1
         self.cooldown_until = time.time() + 4
         self.health_score = max(0, self.health_score - 20)
 
+    def record_failure(self) -> bool:
+        """Count a failed call; returns True when this failure opens the circuit."""
+        self.consecutive_failures += 1
+        if self.consecutive_failures >= CIRCUIT_FAILURE_THRESHOLD:
+            # Also re-opens straight away when the half-open probe fails
+            self.cooldown_until = max(self.cooldown_until, time.time() + CIRCUIT_RECOVERY_SEC)
+            self.probe_until = 0.0
+            return True
+        return False
+
+    def record_success(self):
+        self.consecutive_failures = 0
+        self.probe_until = 0.0
+
     def update_health(self, latency_ms: float, slot_lag: int = 0):
         self.latency_ms = latency_ms
         self.slot_lag = slot_lag
@@ -54,6 +93,7 @@ class RpcManagerService:
         self.fast_pool: List[RpcEndpoint] = []
         self.cold_pool: List[RpcEndpoint] = []
         self.jito_endpoints: List[RpcEndpoint] = []
+        self._by_url: Dict[str, RpcEndpoint] = {}
         self._blockhash_cache: Dict[str, BlockhashContext] = {}
 
     def configure(self, endpoints: List[Dict]):
@@ -68,6 +108,7 @@ class RpcManagerService:
                 self.cold_pool.append(rpc_ep)
             else:
                 self.fast_pool.append(rpc_ep)
+        self._by_url = {ep.url: ep for ep in self.fast_pool + self.cold_pool + self.jito_endpoints}
 
     def configure_from_env(self, env_data: dict):
         endpoints = []
@@ -107,6 +148,16 @@ class RpcManagerService:
         # CRITICAL FIX: Never return RPCs in cooldown - forces proper fallback to cold_pool
         return sorted(all_eps, key=lambda e: -e.health_score)
 
+    def get_top_send_rpcs(self, n: int = 3) -> List[RpcEndpoint]:
+        """Return the n healthiest available endpoints for transaction submission."""
+        return heapq.nlargest(
+            n, (ep for ep in (self.fast_pool + self.cold_pool) if ep.is_available()), key=lambda e: e.health_score
+        )
+
+    def get_all_send_connections(self, n: int = 3) -> List[str]:
+        """URLs to fan a signed transaction out to: available Jito endpoints, then the top-n RPCs."""
+        return [ep.url for ep in self.jito_endpoints if ep.is_available()] + [ep.url for ep in self.get_top_send_rpcs(n)]
+
     def mark_auth_failure(self, url: str):
         """Mark an endpoint as having auth failure (heavy penalty)."""
         for ep in self.fast_pool + self.cold_pool:
@@ -125,6 +176,21 @@ class RpcManagerService:
                 logger.info(f"RPC rate limit, cooldown 60s: {url[:50]}...")
                 break
 
+    def mark_failure(self, url: str):
+        ep = self._by_url.get(url)
+        if ep and ep.record_failure():
+            logger.info(f"RPC circuit open after {ep.consecutive_failures} failures, cooldown {CIRCUIT_RECOVERY_SEC:.0f}s: {url[:50]}...")
+
+    def mark_success(self, url: str):
+        ep = self._by_url.get(url)
+        if ep and ep.consecutive_failures:
+            ep.record_success()
+
+    def admit(self, url: str) -> bool:
+        """False while url's circuit is open or its half-open probe is still out."""
+        ep = self._by_url.get(url)
+        return ep is None or ep.admit()
+
     def get_scoring_connection(self) -> Optional[RpcEndpoint]:
         available = [ep for ep in self.fast_pool if ep.is_available()]
         if len(available) > 1:
@@ -1,22 +1,34 @@
 import os
-import json
 import struct
+import functools
 import time
+import random
 import asyncio
 import logging
-import base58
+try:
+    import based58 as base58  # Rust-backed, same b58encode/b58decode API
+except ImportError:
+    import base58
 import aiohttp
+import httpx
+import orjson
+from contextlib import asynccontextmanager
+from urllib.parse import urlsplit
+from concurrent.futures import ThreadPoolExecutor
+from base64 import b64encode as _b64encode, b64decode as _b64decode
 from typing import Optional, Dict, List, Any, Tuple
 from solders.keypair import Keypair
 from solders.pubkey import Pubkey
 from solders.system_program import TransferParams, transfer
-from solders.transaction import Transaction
+from solders.transaction import Transaction, VersionedTransaction
 from solders.message import Message
 from solders.instruction import Instruction, AccountMeta
 from solders.hash import Hash
 from solders.compute_budget import set_compute_unit_limit, set_compute_unit_price
 
+from services.rpc_manager import CircuitOpen
 from services.tx_error_classifier import TxErrorClassifier
+from services._pump_parser import extract_pump_accounts
 
 logger = logging.getLogger("solana_trader")
 
@@ -40,8 +52,173 @@ SELL_DISCRIMINATOR = bytes.fromhex("33e685a4017f83ad")
 
 TOKEN_PROGRAM_STR = str(TOKEN_PROGRAM)
 TOKEN_2022_PROGRAM_STR = str(TOKEN_2022_PROGRAM)
+PUMP_FUN_PROGRAM_STR = str(PUMP_FUN_PROGRAM)
+# getAccountInfo(base64) only carries base58 text in "owner", so a raw match means pump.fun owns it
+_PUMP_FUN_OWNER_BYTES = f'"{PUMP_FUN_PROGRAM_STR}"'.encode()
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_GET_HEALTH_BODY = b'{"jsonrpc":"2.0","id":1,"method":"getHealth"}'
+# Pre-serialised getTransaction bodies; only the request id and base58 signature vary.
+# The create-TX parse asks for raw base64 (decoded locally, far smaller than jsonParsed);
+# jsonParsed stays for verification and as the fallback when a local decode fails.
+_GET_TX_TEMPLATE = (
+    b'{"jsonrpc":"2.0","id":%d,"method":"getTransaction","params":["%s",'
+    b'{"encoding":"base64","commitment":"confirmed","maxSupportedTransactionVersion":0}]}'
+)
+_GET_TX_PARSED_TEMPLATE = (
+    b'{"jsonrpc":"2.0","id":%d,"method":"getTransaction","params":["%s",'
+    b'{"encoding":"jsonParsed","commitment":"confirmed","maxSupportedTransactionVersion":0}]}'
+)
+# One sendTransaction body per signed TX, shared by every endpoint in the fan-out
+_SEND_TX_TEMPLATE = (
+    b'{"jsonrpc":"2.0","id":1,"method":"sendTransaction","params":["%s",'
+    b'{"encoding":"base64","skipPreflight":true,"preflightCommitment":"processed","maxRetries":0}]}'
+)
+
+# Static accounts that show up in every cloned pump.fun layout, resolved without a base58 decode
+_KNOWN_PUBKEYS = {str(pk): pk for pk in (
+    PUMP_FUN_PROGRAM, PUMP_GLOBAL, PUMP_FEE_RECIPIENT, PUMP_EVENT_AUTHORITY,
+    TOKEN_PROGRAM, TOKEN_2022_PROGRAM, ASSOC_TOKEN_PROGRAM, SYSTEM_PROGRAM,
+    FEE_PROGRAM, GLOBAL_VOLUME_ACCUMULATOR, FEE_CONFIG,
+)}
+
+# Blockhashes stay valid ~150 slots; keep a warm one instead of fetching per TX.
+# BLOCKHASH_CACHE_TTL bounds how old a cached hash may be before a build fetches live;
+# the refresher runs well inside that window so the hot path never waits on it.
+BLOCKHASH_CACHE_TTL = float(os.environ.get("BLOCKHASH_CACHE_TTL", "30"))
+BLOCKHASH_REFRESH_SEC = min(2.0, BLOCKHASH_CACHE_TTL * 0.6)
+
+RPC_RACE_FANOUT = 3
+RPC_SEND_FANOUT = 3
+# A create TX is stale for sniping after ~2s; retry tx_null/RPC misses only within this budget
+TX_FETCH_DEADLINE_MS = 2000.0
+TX_FETCH_ATTEMPT_TIMEOUT = 0.8
+# Between racing rounds: 0.1s doubling per miss, capped, scaled by 0.5-1.5x jitter so nodes aren't hit in lockstep
+TX_FETCH_BACKOFF_BASE = 0.1
+TX_FETCH_BACKOFF_MAX = 1.5
+# RPC errors that a later getTransaction round cannot fix; other nodes in the same round are still raced
+_TERMINAL_RPC_ERRORS = frozenset({"not_authorized", "insufficient_funds", "slippage_exceeded"})
+_TERMINAL_TX_FETCH_REASONS = frozenset(f"rpc_{err_type}" for err_type in _TERMINAL_RPC_ERRORS)
+# Bulkheads: RPC requests in flight overall and per host (matching the connector's pool sizes),
+# and buys in flight before new ones are shed instead of queued behind slow RPCs
+RPC_MAX_INFLIGHT = int(os.environ.get("RPC_MAX_INFLIGHT", "64"))
+RPC_HOST_MAX_INFLIGHT = int(os.environ.get("RPC_HOST_MAX_INFLIGHT", "16"))
+BUY_MAX_INFLIGHT = int(os.environ.get("BUY_MAX_INFLIGHT", "8"))
+# Opt-in HTTP/2 for JSON-RPC POSTs: one multiplexed connection per host instead of a pool of
+# HTTP/1.1 sockets. Hosts that don't offer h2 over ALPN are spoken to in HTTP/1.1 by the same client.
+RPC_HTTP2 = os.environ.get("RPC_HTTP2", "").lower() in ("1", "true", "yes")
+PARSE_OFFLOAD_MIN_KEYS = 32
+SELL_SCAFFOLD_MAX = 1024
+
+
+# discriminator(8) + amount(u64) + sol limit(u64) + track_volume(1, left false) in one precompiled C call
+_pack_trade_data = struct.Struct("<8sQQx").pack
+
+# Compute-budget instructions are identical on every buy/sell; build them once
+_CU_LIMIT_IX = set_compute_unit_limit(200_000)
+_CU_PRICE_IX = set_compute_unit_price(500_000)
+
+
+def _orjson_dumps_str(obj: Any) -> str:
+    return orjson.dumps(obj).decode()
+
+
+@functools.lru_cache(maxsize=256)
+def _url_host(url: str) -> str:
+    return urlsplit(url).netloc
+
+
+async def _acquire_by(sem: asyncio.Semaphore, deadline: float) -> None:
+    """Acquire sem, or raise asyncio.TimeoutError once time.monotonic() passes deadline."""
+    if not sem.locked():
+        # Free slot: acquire() returns without suspending, skip the wait_for task
+        await sem.acquire()
+        return
+    await asyncio.wait_for(sem.acquire(), max(deadline - time.monotonic(), 0.0))
+
+
+def _decode_base64_tx(tx_data: Dict) -> Dict:
+    """Reshape a base64 getTransaction result into the jsonParsed layout _extract_pump_accounts reads.
+
+    Only the pump.fun instruction is carried over; other instructions are dropped.
+    """
+    msg = VersionedTransaction.from_bytes(_b64decode(tx_data["transaction"][0])).message
+    meta = tx_data.get("meta")
+    header = msg.header
+    n_static = len(msg.account_keys)
+    n_signers = header.num_required_signatures
+    writable_signers = n_signers - header.num_readonly_signed_accounts
+    writable_static = n_static - header.num_readonly_unsigned_accounts
+
+    account_keys = [
+        {"pubkey": str(pk), "signer": i < n_signers,
+         "writable": i < writable_signers if i < n_signers else i < writable_static}
+        for i, pk in enumerate(msg.account_keys)
+    ]
+    # v0 lookup-table keys follow the static ones: all writable, then all readonly
+    loaded = (meta or {}).get("loadedAddresses") or {}
+    account_keys += [{"pubkey": k, "signer": False, "writable": True} for k in loaded.get("writable", ())]
+    account_keys += [{"pubkey": k, "signer": False, "writable": False} for k in loaded.get("readonly", ())]
+    names = [ak["pubkey"] for ak in account_keys]
+    # Only one pump.fun instruction is ever read; find it by key index (an int compare per
+    # instruction) and surface just that one instead of resolving every inner instruction's accounts
+    pump_idx = frozenset(i for i, name in enumerate(names) if name == PUMP_FUN_PROGRAM_STR)
+
+    instructions = []
+    inner = []
+    top_ix = next((ix for ix in msg.instructions if ix.program_id_index in pump_idx), None)
+    if top_ix is not None:
+        # base58 in Python is slow; only the pump.fun instruction's data is ever surfaced
+        instructions.append({
+            "programId": PUMP_FUN_PROGRAM_STR, "accounts": [names[a] for a in top_ix.accounts],
+            "data": base58.b58encode(top_ix.data).decode(),
+        })
+    elif meta is not None:
+        # Same pick as extract_pump_accounts: the first pump ix of the last inner group that has one
+        for group in meta.get("innerInstructions") or ():
+            ix = next((ix for ix in group.get("instructions", ()) if ix.get("programIdIndex") in pump_idx), None)
+            if ix is not None:
+                inner = [{"index": group.get("index"), "instructions": [{
+                    "programId": PUMP_FUN_PROGRAM_STR, "accounts": [names[a] for a in ix.get("accounts", ())],
+                    "data": ix.get("data", ""),
+                }]}]
+    if meta is not None:
+        meta = dict(meta)
+        meta["innerInstructions"] = inner
+    return {**tx_data, "meta": meta,
+            "transaction": {"message": {"accountKeys": account_keys, "instructions": instructions}}}
+
+
+def _tx_template(msg_bytes: bytes, data: bytes) -> Optional[Tuple[bytes, int, int]]:
+    """Locate the blockhash and trade-data windows in a single-signer legacy message, or None."""
+    # header(3) + shortvec key count (1 byte while < 128) + 32 bytes per key, then the blockhash
+    if msg_bytes[0] != 1 or msg_bytes[3] > 0x7F:
+        return None
+    bh_off = 4 + 32 * msg_bytes[3]
+    data_off = msg_bytes.find(data, bh_off + 32)
+    if data_off < 0 or msg_bytes.find(data, data_off + 1) >= 0:
+        return None
+    return msg_bytes, bh_off, data_off
+
+
+def _pubkey_from_meta(am: Dict) -> Pubkey:
+    """Resolve a cloned account meta, skipping the base58 decode for the static program accounts."""
+    pubkey_str = am["pubkey"]
+    return _KNOWN_PUBKEYS.get(pubkey_str) or Pubkey.from_string(pubkey_str)
+
+
+@functools.lru_cache(maxsize=4096)
+def _pk(pubkey_str: str) -> Pubkey:
+    """Decode a base58 pubkey once; mints and curves recur between buy, sell and retries."""
+    return Pubkey.from_string(pubkey_str)
+
 
+@functools.lru_cache(maxsize=8192)
+def _creator_vault(creator_bytes: bytes) -> Pubkey:
+    return Pubkey.find_program_address([b"creator-vault", creator_bytes], PUMP_FUN_PROGRAM)[0]
 
+
+# ATA PDAs recur for the same wallet/mint across buy, sell and retries
+@functools.lru_cache(maxsize=4096)
 def get_associated_token_address(wallet: Pubkey, mint: Pubkey, token_program: Pubkey = None) -> Pubkey:
     tp = token_program or TOKEN_2022_PROGRAM
     seeds = [bytes(wallet), bytes(tp), bytes(mint)]
@@ -49,6 +226,56 @@ def get_associated_token_address(wallet: Pubkey, mint: Pubkey, token_program: Pu
     return pda
 
 
+# Shared buy/sell account layout; None marks the per-trade slots filled in by _pump_trade_accounts
+_PUMP_TRADE_ACCOUNTS_TEMPLATE = (
+    AccountMeta(PUMP_GLOBAL, is_signer=False, is_writable=False),          # 0: global
+    AccountMeta(PUMP_FEE_RECIPIENT, is_signer=False, is_writable=True),    # 1: fee_recipient
+    None,                                                                  # 2: mint
+    None,                                                                  # 3: bonding_curve
+    None,                                                                  # 4: associated_bonding_curve
+    None,                                                                  # 5: associated_user
+    None,                                                                  # 6: user (signer)
+    AccountMeta(SYSTEM_PROGRAM, is_signer=False, is_writable=False),       # 7: system_program
+    None,                                                                  # 8: token_program
+    None,                                                                  # 9: creator_vault
+    AccountMeta(PUMP_EVENT_AUTHORITY, is_signer=False, is_writable=False), # 10: event_authority
+    AccountMeta(PUMP_FUN_PROGRAM, is_signer=False, is_writable=False),     # 11: program
+    AccountMeta(GLOBAL_VOLUME_ACCUMULATOR, is_signer=False, is_writable=False), # 12: global_volume_accumulator
+    None,                                                                  # 13: user_volume_accumulator
+    AccountMeta(FEE_CONFIG, is_signer=False, is_writable=False),           # 14: fee_config
+    AccountMeta(FEE_PROGRAM, is_signer=False, is_writable=False),          # 15: fee_program
+)
+
+
+def _with_token_program(token_program: Pubkey) -> tuple:
+    accounts = list(_PUMP_TRADE_ACCOUNTS_TEMPLATE)
+    accounts[8] = AccountMeta(token_program, is_signer=False, is_writable=False)
+    return tuple(accounts)
+
+
+# Pump.fun mints only ever use one of the two token programs; bake slot 8 in per program
+_PUMP_TRADE_TEMPLATES = {
+    TOKEN_PROGRAM: _with_token_program(TOKEN_PROGRAM),
+    TOKEN_2022_PROGRAM: _with_token_program(TOKEN_2022_PROGRAM),
+}
+
+
+def _pump_trade_accounts(
+    user: Pubkey, mint: Pubkey, bonding_curve: Pubkey,
+    associated_bonding_curve: Pubkey, user_ata: Pubkey, token_program: Pubkey,
+    creator_vault: Pubkey, user_volume_accumulator: Pubkey
+) -> List[AccountMeta]:
+    accounts = list(_PUMP_TRADE_TEMPLATES.get(token_program) or _with_token_program(token_program))
+    accounts[2] = AccountMeta(mint, is_signer=False, is_writable=False)
+    accounts[3] = AccountMeta(bonding_curve, is_signer=False, is_writable=True)
+    accounts[4] = AccountMeta(associated_bonding_curve, is_signer=False, is_writable=True)
+    accounts[5] = AccountMeta(user_ata, is_signer=False, is_writable=True)
+    accounts[6] = AccountMeta(user, is_signer=True, is_writable=True)
+    accounts[9] = AccountMeta(creator_vault, is_signer=False, is_writable=True)
+    accounts[13] = AccountMeta(user_volume_accumulator, is_signer=False, is_writable=True)
+    return accounts
+
+
 def build_buy_instruction(
     buyer: Pubkey, mint: Pubkey, bonding_curve: Pubkey,
     associated_bonding_curve: Pubkey, buyer_ata: Pubkey,
@@ -57,26 +284,11 @@ def build_buy_instruction(
     token_program: Pubkey = None
 ) -> Instruction:
     tp = token_program or TOKEN_2022_PROGRAM
-    # Data: discriminator(8) + amount(8) + max_sol_cost(8) + track_volume(1)
-    data = BUY_DISCRIMINATOR + struct.pack("<Q", token_amount) + struct.pack("<Q", max_sol_cost) + bytes([0])
-    accounts = [
-        AccountMeta(PUMP_GLOBAL, is_signer=False, is_writable=False),          # 0: global
-        AccountMeta(PUMP_FEE_RECIPIENT, is_signer=False, is_writable=True),    # 1: fee_recipient
-        AccountMeta(mint, is_signer=False, is_writable=False),                 # 2: mint
-        AccountMeta(bonding_curve, is_signer=False, is_writable=True),         # 3: bonding_curve
-        AccountMeta(associated_bonding_curve, is_signer=False, is_writable=True), # 4: associated_bonding_curve
-        AccountMeta(buyer_ata, is_signer=False, is_writable=True),             # 5: associated_user
-        AccountMeta(buyer, is_signer=True, is_writable=True),                  # 6: user (signer)
-        AccountMeta(SYSTEM_PROGRAM, is_signer=False, is_writable=False),       # 7: system_program
-        AccountMeta(tp, is_signer=False, is_writable=False),                   # 8: token_program
-        AccountMeta(creator_vault, is_signer=False, is_writable=True),         # 9: creator_vault
-        AccountMeta(PUMP_EVENT_AUTHORITY, is_signer=False, is_writable=False), # 10: event_authority
-        AccountMeta(PUMP_FUN_PROGRAM, is_signer=False, is_writable=False),     # 11: program
-        AccountMeta(GLOBAL_VOLUME_ACCUMULATOR, is_signer=False, is_writable=False), # 12: global_volume_accumulator
-        AccountMeta(user_volume_accumulator, is_signer=False, is_writable=True),    # 13: user_volume_accumulator
-        AccountMeta(FEE_CONFIG, is_signer=False, is_writable=False),           # 14: fee_config
-        AccountMeta(FEE_PROGRAM, is_signer=False, is_writable=False),          # 15: fee_program
-    ]
+    data = _pack_trade_data(BUY_DISCRIMINATOR, token_amount, max_sol_cost)
+    accounts = _pump_trade_accounts(
+        buyer, mint, bonding_curve, associated_bonding_curve, buyer_ata, tp,
+        creator_vault, user_volume_accumulator
+    )
     return Instruction(PUMP_FUN_PROGRAM, data, accounts)
 
 
@@ -88,42 +300,38 @@ def build_sell_instruction(
     token_program: Pubkey = None
 ) -> Instruction:
     tp = token_program or TOKEN_2022_PROGRAM
-    # Data: discriminator(8) + amount(8) + min_sol_output(8) + track_volume(1)
-    data = SELL_DISCRIMINATOR + struct.pack("<Q", token_amount) + struct.pack("<Q", min_sol_output) + bytes([0])
-    accounts = [
-        AccountMeta(PUMP_GLOBAL, is_signer=False, is_writable=False),          # 0: global
-        AccountMeta(PUMP_FEE_RECIPIENT, is_signer=False, is_writable=True),    # 1: fee_recipient
-        AccountMeta(mint, is_signer=False, is_writable=False),                 # 2: mint
-        AccountMeta(bonding_curve, is_signer=False, is_writable=True),         # 3: bonding_curve
-        AccountMeta(associated_bonding_curve, is_signer=False, is_writable=True), # 4: associated_bonding_curve
-        AccountMeta(seller_ata, is_signer=False, is_writable=True),            # 5: associated_user
-        AccountMeta(seller, is_signer=True, is_writable=True),                 # 6: user (signer)
-        AccountMeta(SYSTEM_PROGRAM, is_signer=False, is_writable=False),       # 7: system_program
-        AccountMeta(tp, is_signer=False, is_writable=False),                   # 8: token_program
-        AccountMeta(creator_vault, is_signer=False, is_writable=True),         # 9: creator_vault
-        AccountMeta(PUMP_EVENT_AUTHORITY, is_signer=False, is_writable=False), # 10: event_authority
-        AccountMeta(PUMP_FUN_PROGRAM, is_signer=False, is_writable=False),     # 11: program
-        AccountMeta(GLOBAL_VOLUME_ACCUMULATOR, is_signer=False, is_writable=False), # 12: global_volume_accumulator
-        AccountMeta(user_volume_accumulator, is_signer=False, is_writable=True),    # 13: user_volume_accumulator
-        AccountMeta(FEE_CONFIG, is_signer=False, is_writable=False),           # 14: fee_config
-        AccountMeta(FEE_PROGRAM, is_signer=False, is_writable=False),          # 15: fee_program
-    ]
+    data = _pack_trade_data(SELL_DISCRIMINATOR, token_amount, min_sol_output)
+    accounts = _pump_trade_accounts(
+        seller, mint, bonding_curve, associated_bonding_curve, seller_ata, tp,
+        creator_vault, user_volume_accumulator
+    )
     return Instruction(PUMP_FUN_PROGRAM, data, accounts)
 
 
-def build_create_ata_idempotent(payer: Pubkey, owner: Pubkey, mint: Pubkey, token_program: Pubkey = None) -> Instruction:
-    tp = token_program or TOKEN_2022_PROGRAM
-    ata = get_associated_token_address(owner, mint, tp)
-    accounts = [
+# Same payer/owner/mint on a buy and its retries. AccountMeta is immutable, so the metas can be
+# shared; Instruction.accounts is writable, so every caller still gets its own Instruction.
+@functools.lru_cache(maxsize=1024)
+def _create_ata_accounts(
+    payer: Pubkey, owner: Pubkey, mint: Pubkey, tp: Pubkey, ata: Optional[Pubkey]
+) -> Tuple[AccountMeta, ...]:
+    if ata is None:
+        ata = get_associated_token_address(owner, mint, tp)
+    return (
         AccountMeta(payer, is_signer=True, is_writable=True),
         AccountMeta(ata, is_signer=False, is_writable=True),
         AccountMeta(owner, is_signer=False, is_writable=False),
         AccountMeta(mint, is_signer=False, is_writable=False),
         AccountMeta(SYSTEM_PROGRAM, is_signer=False, is_writable=False),
         AccountMeta(tp, is_signer=False, is_writable=False),
-    ]
-    data = bytes([1])
-    return Instruction(ASSOC_TOKEN_PROGRAM, data, accounts)
+    )
+
+
+def build_create_ata_idempotent(
+    payer: Pubkey, owner: Pubkey, mint: Pubkey, token_program: Pubkey = None,
+    ata: Optional[Pubkey] = None
+) -> Instruction:
+    accounts = _create_ata_accounts(payer, owner, mint, token_program or TOKEN_2022_PROGRAM, ata)
+    return Instruction(ASSOC_TOKEN_PROGRAM, bytes([1]), list(accounts))
 
 
 class SolanaTrader:
@@ -134,9 +342,112 @@ class SolanaTrader:
         self.jito_tip_account = os.environ.get("JITO_TIP_ACCOUNT", "")
         self.tip_amount_sol = float(os.environ.get("JITO_TIP_AMOUNT", "0.015"))
         self._keypair: Optional[Keypair] = None
+        self._pubkey: Optional[Pubkey] = None
+        self._pubkey_bytes: bytes = b""
+        self._pubkey_str: str = ""
+        self._user_volume_acc: Optional[Pubkey] = None
+        self._http: Optional[aiohttp.ClientSession] = None
+        self._h2: Optional[httpx.AsyncClient] = None
+        self._h2_enabled = RPC_HTTP2
+        self._bh_cache: Optional[Dict] = None
+        self._bh_task: Optional[asyncio.Task] = None
+        self._bh_fetch: Optional[asyncio.Task] = None
+        self._sell_scaffold: Dict[Tuple, Tuple[List[AccountMeta], str]] = {}
+        # position -> (blockhash, accounts, template) the template was built and checked against
+        self._sell_templates: Dict[Tuple, Tuple[bytes, List[AccountMeta], Tuple[bytes, int, int]]] = {}
+        self._parse_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="tx-parse")
+        self._tip_key: Optional[Tuple] = None
+        self._tip_ix: Optional[Instruction] = None
+        self._rpc_sem = asyncio.Semaphore(RPC_MAX_INFLIGHT)
+        self._host_sems: Dict[str, asyncio.Semaphore] = {}
+        self._buy_sem = asyncio.Semaphore(BUY_MAX_INFLIGHT)
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Shared keep-alive session so RPC calls skip the TCP/TLS handshake."""
+        if not self._http or self._http.closed:
+            self._http = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=RPC_MAX_INFLIGHT, limit_per_host=RPC_HOST_MAX_INFLIGHT,
+                    keepalive_timeout=60, ttl_dns_cache=300
+                ),
+                json_serialize=_orjson_dumps_str,
+            )
+        return self._http
+
+    @asynccontextmanager
+    async def _rpc_slot(self, url: str, timeout: float):
+        """Hold a global and a per-host RPC slot around one request; yields the time left.
+
+        A slow host queues its own callers instead of timing out everyone else's
+        waiting in the shared pool. The wait counts against the request's timeout:
+        a caller that cannot get both slots in time gets the asyncio.TimeoutError a
+        timed-out RPC raises, and the POST itself only gets what is left.
+        """
+        host = _url_host(url)
+        host_sem = self._host_sems.get(host)
+        if host_sem is None:
+            host_sem = self._host_sems[host] = asyncio.Semaphore(RPC_HOST_MAX_INFLIGHT)
+        deadline = time.monotonic() + timeout
+        await _acquire_by(self._rpc_sem, deadline)
+        try:
+            await _acquire_by(host_sem, deadline)
+        except BaseException:
+            self._rpc_sem.release()
+            raise
+        try:
+            yield deadline - time.monotonic()
+        finally:
+            host_sem.release()
+            self._rpc_sem.release()
 
-    def _select_rpcs(self) -> List[str]:
-        rpcs = self._select_rpcs()
+    def _buys_saturated(self) -> Optional[Dict]:
+        if not self._buy_sem.locked():
+            return None
+        logger.warning("Buy bulkhead full (%d in flight) - shedding", BUY_MAX_INFLIGHT)
+        return {
+            "success": False,
+            "error": "Too many buys in flight",
+            "error_type": "buy_bulkhead_full",
+            "error_expected": True
+        }
+
+    def _get_h2_client(self) -> Optional[httpx.AsyncClient]:
+        """Shared HTTP/2 client when RPC_HTTP2 is set; None means use the aiohttp session."""
+        if not self._h2_enabled:
+            return None
+        if self._h2 is None or self._h2.is_closed:
+            try:
+                self._h2 = httpx.AsyncClient(
+                    http2=True,
+                    limits=httpx.Limits(max_connections=RPC_MAX_INFLIGHT, keepalive_expiry=60),
+                    timeout=httpx.Timeout(10.0, connect=2.0),
+                )
+            except ImportError as e:
+                # http2=True needs the h2 package; keep trading over aiohttp without it
+                logger.warning("RPC_HTTP2 set but HTTP/2 support is unavailable, using HTTP/1.1: %s", e)
+                self._h2_enabled = False
+                return None
+        return self._h2
+
+    def get_http_session(self) -> aiohttp.ClientSession:
+        """The pooled session, for other services in this process that talk HTTP (e.g. Telegram)."""
+        return self._get_session()
+
+    async def close(self):
+        self.stop_blockhash_refresher()
+        if self._http:
+            await self._http.close()
+            self._http = None
+        if self._h2:
+            await self._h2.aclose()
+            self._h2 = None
+        self._parse_pool.shutdown(wait=False)
+
+    def _select_rpcs(self, rpc_url: str = None) -> List[str]:
+        # dict.fromkeys: ordered O(1) de-dup, caller's preferred URL first
+        rpcs = list(dict.fromkeys(
+            ([rpc_url] if rpc_url else []) + [ep.url for ep in self.rpc_manager.get_all_available_rpcs()]
+        ))
         non_helius = [u for u in rpcs if "helius-rpc.com" not in u]
         if non_helius:
             rpcs = non_helius
@@ -149,109 +460,241 @@ class SolanaTrader:
             return None
         for url in rpcs[:2]:
             try:
-                async with aiohttp.ClientSession() as session:
-                    payload = {
-                        "jsonrpc": "2.0", "id": 1, "method": "getAccountInfo",
-                        "params": [bonding_curve_str, {"encoding": "base64"}]
-                    }
-                    async with session.post(url, json=payload, timeout=aiohttp.ClientTimeout(total=5)) as resp:
-                        data = await resp.json()
-                        if "error" in data:
-                            err_code = data["error"].get("code", 0) if isinstance(data["error"], dict) else 0
-                            if err_code == -32401:
-                                self.rpc_manager.mark_auth_failure(url)
-                                continue
-                            continue
-                        value = data.get("result", {}).get("value")
-                        if not value:
-                            continue
-                        import base64 as b64
-                        raw = b64.b64decode(value["data"][0])
-                        # BondingCurve layout: disc(8) + 5*u64(40) + bool(1) + creator(32)
-                        if len(raw) < 81:
-                            continue
-                        creator_bytes = raw[49:81]
-                        creator = Pubkey.from_bytes(creator_bytes)
-                        logger.info(f"BC creator: {str(creator)[:12]}...")
-                        return creator
+                payload = {
+                    "jsonrpc": "2.0", "id": 1, "method": "getAccountInfo",
+                    "params": [bonding_curve_str, {"encoding": "base64"}]
+                }
+                data = await self._rpc_post(url, orjson.dumps(payload), 5)
+                if "error" in data:
+                    err_code = data["error"].get("code", 0) if isinstance(data["error"], dict) else 0
+                    if err_code == -32401:
+                        self.rpc_manager.mark_auth_failure(url)
+                        continue
+                    continue
+                value = data.get("result", {}).get("value")
+                if not value:
+                    continue
+                raw = _b64decode(value["data"][0])
+                # BondingCurve layout: disc(8) + 5*u64(40) + bool(1) + creator(32)
+                if len(raw) < 81:
+                    continue
+                creator_bytes = raw[49:81]
+                creator = Pubkey.from_bytes(creator_bytes)
+                logger.info("BC creator: %.12s...", creator)
+                return creator
+            except CircuitOpen:
+                continue
             except Exception as e:
                 logger.error(f"fetch_bonding_curve_creator error: {e}")
         return None
 
+    def _cache_pubkey(self):
+        pk = self._keypair.pubkey()
+        self._pubkey = pk
+        self._pubkey_bytes = bytes(pk)
+        self._pubkey_str = str(pk)
+        self._user_volume_acc, _ = Pubkey.find_program_address(
+            [b"user_volume_accumulator", self._pubkey_bytes], PUMP_FUN_PROGRAM
+        )
+
+    def _tip_instruction(self) -> Optional[Instruction]:
+        """Jito tip transfer from our wallet, rebuilt only when the wallet, tip account or amount changes."""
+        if not self.jito_tip_account:
+            return None
+        key = (self._pubkey_str, self.jito_tip_account, self.tip_amount_sol)
+        if key != self._tip_key:
+            self._tip_ix = transfer(TransferParams(
+                from_pubkey=self._pubkey,
+                to_pubkey=Pubkey.from_string(self.jito_tip_account),
+                lamports=int(self.tip_amount_sol * 1e9)
+            ))
+            self._tip_key = key
+        return self._tip_ix
+
+    @staticmethod
+    def _patch_template(template: Tuple[bytes, int, int], blockhash: bytes, data: bytes) -> bytes:
+        msg_template, bh_off, data_off = template
+        msg = bytearray(msg_template)
+        msg[bh_off:bh_off + 32] = blockhash
+        msg[data_off:data_off + len(data)] = data
+        return bytes(msg)
+
+    def _sign_template(self, template: Tuple[bytes, int, int], blockhash: bytes, data: bytes) -> bytes:
+        msg = self._patch_template(template, blockhash, data)
+        return b"\x01" + bytes(self._keypair.sign_message(msg)) + msg
+
     def load_keypair(self, key_bytes: bytes):
         if len(key_bytes) == 64:
             self._keypair = Keypair.from_bytes(key_bytes)
         elif len(key_bytes) == 32:
             self._keypair = Keypair.from_seed(key_bytes)
-        logger.info(f"Keypair loaded: {self._keypair.pubkey()}")
+        self._cache_pubkey()
+        logger.info(f"Keypair loaded: {self._pubkey_str}")
 
     def load_keypair_from_wallet(self):
         if self.wallet_service._key_bytes:
             seed = self.wallet_service._key_bytes
             self._keypair = Keypair.from_seed(seed)
-            logger.info(f"Keypair loaded from wallet service: {self._keypair.pubkey()}")
+            self._cache_pubkey()
+            logger.info(f"Keypair loaded from wallet service: {self._pubkey_str}")
             return True
         return False
 
     async def get_latest_blockhash(self, rpc_url: str = None) -> Optional[Dict]:
-        rpcs = []
-        if rpc_url:
-            rpcs.append(rpc_url)
-        for ep in self.rpc_manager.get_all_available_rpcs():
-            if ep.url not in rpcs:
-                rpcs.append(ep.url)
-        non_helius = [u for u in rpcs if "helius-rpc.com" not in u]
-        if non_helius:
-            rpcs = non_helius
-        rpcs = sorted(rpcs, key=lambda u: 0 if "extrnode" in u else 1)
+        """Race getLatestBlockhash across the top RPCs; the first usable hash wins."""
+        rpcs = self._select_rpcs(rpc_url)
         if not rpcs:
             logger.debug("No RPC URL available for getLatestBlockhash")
             return None
 
-        url = rpcs[0]
+        tasks = [asyncio.create_task(self._fetch_blockhash(url)) for url in rpcs[:RPC_RACE_FANOUT]]
         try:
-            async with aiohttp.ClientSession() as session:
-                payload = {"jsonrpc": "2.0", "id": 1, "method": "getLatestBlockhash",
-                           "params": [{"commitment": "processed"}]}
-                async with session.post(url, json=payload, timeout=aiohttp.ClientTimeout(total=5)) as resp:
-                    data = await resp.json()
-                    if "error" in data:
-                        err_code = data["error"].get("code", 0) if isinstance(data["error"], dict) else 0
-                        if err_code == -32401:
-                            self.rpc_manager.mark_auth_failure(url)
-                        return None
-                    result = data.get("result", {}).get("value", {})
-                    bh = result.get("blockhash")
-                    if not bh:
-                        return None
-                    return {
-                        "blockhash": bh,
-                        "last_valid_block_height": result.get("lastValidBlockHeight"),
-                        "rpc_url": url
-                    }
+            for fut in asyncio.as_completed(tasks):
+                ctx = await fut
+                if ctx:
+                    return ctx
+        finally:
+            for task in tasks:
+                task.cancel()
+        return None
+
+    async def _rpc_post(self, url: str, body: bytes, timeout: float, raw: bool = False) -> Any:
+        """POST a JSON-RPC body and decode the reply, feeding the endpoint's circuit breaker.
+
+        Every JSON-RPC request goes through here, so all of them share the transport
+        (HTTP/2 client or the aiohttp pool), the bulkheads and the breaker.
+        raw=True returns the undecoded body for callers that scan the bytes first.
+        """
+        if not self.rpc_manager.admit(url):
+            raise CircuitOpen(url)
+        h2 = self._get_h2_client()
+        # A full bulkhead raises before the try: local saturation is not the endpoint's failure
+        async with self._rpc_slot(url, timeout) as remaining:
+            try:
+                if h2 is not None:
+                    resp = await h2.post(url, content=body, headers=_JSON_HEADERS, timeout=remaining)
+                    failed = resp.status_code >= 500 or resp.status_code == 429
+                    content = resp.content
+                else:
+                    async with self._get_session().post(
+                        url, data=body, headers=_JSON_HEADERS, timeout=aiohttp.ClientTimeout(total=remaining)
+                    ) as resp:
+                        failed = resp.status >= 500 or resp.status == 429
+                        content = await resp.read()
+                data = content if raw else orjson.loads(content)
+            except Exception:
+                # Timeouts, resets and garbage bodies; cancelled race losers are not failures
+                self.rpc_manager.mark_failure(url)
+                raise
+        if failed:
+            self.rpc_manager.mark_failure(url)
+        else:
+            self.rpc_manager.mark_success(url)
+        return data
+
+    async def _fetch_blockhash(self, url: str) -> Optional[Dict]:
+        try:
+            payload = {"jsonrpc": "2.0", "id": 1, "method": "getLatestBlockhash",
+                       "params": [{"commitment": "processed"}]}
+            data = await self._rpc_post(url, orjson.dumps(payload), 5)
+            if "error" in data:
+                err_code = data["error"].get("code", 0) if isinstance(data["error"], dict) else 0
+                if err_code == -32401:
+                    self.rpc_manager.mark_auth_failure(url)
+                return None
+            result = data.get("result", {}).get("value", {})
+            bh = result.get("blockhash")
+            if not bh:
+                return None
+            return {
+                "blockhash": bh,
+                # Parsed once here so every TX built from this context skips the base58 decode
+                "blockhash_parsed": Hash.from_string(bh),
+                "last_valid_block_height": result.get("lastValidBlockHeight"),
+                "rpc_url": url
+            }
         except Exception:
             return None
 
+    def start_blockhash_refresher(self):
+        if not self._bh_task or self._bh_task.done():
+            self._bh_task = asyncio.create_task(self._blockhash_refresher())
+
+    def stop_blockhash_refresher(self):
+        if self._bh_task:
+            self._bh_task.cancel()
+            self._bh_task = None
+
+    async def warm_connections(self):
+        """Open keep-alive connections to every send/fetch endpoint ahead of the first trade.
+
+        Goes through _rpc_post, so it warms whichever transport trades will use (HTTP/2 or aiohttp).
+        """
+        urls = list(dict.fromkeys(self._send_urls() + self._select_rpcs()[:RPC_RACE_FANOUT]))
+
+        async def _ping(url: str):
+            try:
+                await self._rpc_post(url, _GET_HEALTH_BODY, 3, raw=True)
+            except Exception as e:
+                logger.debug(f"Connection warm-up failed for {url[:40]}: {e}")
+
+        await asyncio.gather(*(_ping(url) for url in urls))
+
+    async def _blockhash_refresher(self):
+        await self.warm_connections()
+        while True:
+            try:
+                await asyncio.shield(self._blockhash_fetch())
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.debug(f"Blockhash refresh failed: {e}")
+            await asyncio.sleep(BLOCKHASH_REFRESH_SEC)
+
+    def _blockhash_fetch(self) -> asyncio.Task:
+        """The in-flight blockhash fetch, started if there is none.
+
+        Single-flight: the refresher, stale builds and post-expiry refetches all
+        await one getLatestBlockhash race instead of each issuing their own.
+        """
+        task = self._bh_fetch
+        if task is None or task.done():
+            task = self._bh_fetch = asyncio.create_task(self._fetch_and_cache_blockhash())
+        return task
+
+    async def _fetch_and_cache_blockhash(self) -> Optional[Dict]:
+        ctx = await self.get_latest_blockhash()
+        if ctx:
+            ctx["fetched_at"] = time.monotonic()
+            self._bh_cache = ctx
+        return ctx
+
+    async def _get_blockhash_ctx(self) -> Optional[Dict]:
+        """Warm blockhash from the refresher; live fetch only when it has gone stale."""
+        ctx = self._bh_cache
+        if ctx and time.monotonic() - ctx["fetched_at"] < BLOCKHASH_CACHE_TTL:
+            return ctx
+        # Shielded: a cancelled caller (e.g. a lost race) must not abort the fetch others await
+        return await asyncio.shield(self._blockhash_fetch())
+
     async def wait_for_signature_status(self, signature: str, max_wait: float = 2.0) -> bool:
         rpcs = self._select_rpcs()
         if not rpcs:
             return False
         url = rpcs[0]
         try:
-            async with aiohttp.ClientSession() as session:
-                payload = {
-                    "jsonrpc": "2.0", "id": 1, "method": "getSignatureStatuses",
-                    "params": [[signature], {"searchTransactionHistory": False}]
-                }
-                async with session.post(url, json=payload, timeout=aiohttp.ClientTimeout(total=5)) as resp:
-                    data = await resp.json()
-                    if "error" in data:
-                        err_code = data["error"].get("code", 0) if isinstance(data["error"], dict) else 0
-                        if err_code == -32401:
-                            self.rpc_manager.mark_auth_failure(url)
-                        return False
-                    value = (data.get("result") or {}).get("value", [])
-                    return bool(value and value[0])
+            payload = {
+                "jsonrpc": "2.0", "id": 1, "method": "getSignatureStatuses",
+                "params": [[signature], {"searchTransactionHistory": False}]
+            }
+            data = await self._rpc_post(url, orjson.dumps(payload), 5)
+            if "error" in data:
+                err_code = data["error"].get("code", 0) if isinstance(data["error"], dict) else 0
+                if err_code == -32401:
+                    self.rpc_manager.mark_auth_failure(url)
+                return False
+            value = (data.get("result") or {}).get("value", [])
+            return bool(value and value[0])
         except Exception:
             return False
 
@@ -279,15 +722,15 @@ class SolanaTrader:
                 logger.error("No account_metas_clone available - cannot perform Clone & Inject")
                 return None
             
-            mint = Pubkey.from_string(mint_str)
-            buyer = self._keypair.pubkey()
+            mint = _pk(mint_str)
+            buyer = self._pubkey
             
             # Determine token program
             tp = TOKEN_2022_PROGRAM if token_program_str == TOKEN_2022_PROGRAM_STR else TOKEN_PROGRAM
             buyer_ata = get_associated_token_address(buyer, mint, tp)
             
             if not blockhash_ctx:
-                blockhash_ctx = await self.get_latest_blockhash()
+                blockhash_ctx = await self._get_blockhash_ctx()
             if not blockhash_ctx or not blockhash_ctx.get("blockhash"):
                 logger.error("Failed to get blockhash")
                 return None
@@ -298,63 +741,48 @@ class SolanaTrader:
             max_sol_with_slippage = int(max_sol_lamports * (1 + slippage_pct / 100))
 
             # Build instruction data for BUY (discriminator + amount + max_sol_cost + track_volume)
-            data = BUY_DISCRIMINATOR + struct.pack("<Q", token_amount) + struct.pack("<Q", max_sol_with_slippage) + bytes([0])
+            data = _pack_trade_data(BUY_DISCRIMINATOR, token_amount, max_sol_with_slippage)
 
             # Clone account metas EXACTLY from original CREATE instruction
             # Modify ONLY: signer (index 6) and associated_user (index 5 = buyer_ata)
-            cloned_accounts = []
-            for i, am in enumerate(account_metas_clone):
-                pubkey = Pubkey.from_string(am["pubkey"])
-                is_signer = am["isSigner"]
-                is_writable = am["isWritable"]
-                
-                # Replace creator (signer at index 6) with our buyer
-                if i == 6 and is_signer:
-                    pubkey = buyer
-                    logger.info(f"CLONE: Replacing signer at index {i} with buyer {str(buyer)[:12]}...")
-                
-                # Replace associated_user (index 5) with our buyer_ata
-                elif i == 5:
-                    pubkey = buyer_ata
-                    logger.info(f"CLONE: Replacing buyer_ata at index {i} with {str(buyer_ata)[:12]}...")
-                
-                cloned_accounts.append(AccountMeta(pubkey, is_signer=is_signer, is_writable=is_writable))
+            cloned_accounts = [
+                AccountMeta(_pubkey_from_meta(am), is_signer=am["isSigner"], is_writable=am["isWritable"])
+                for am in account_metas_clone
+            ]
+            if len(cloned_accounts) > 5:
+                am = account_metas_clone[5]
+                cloned_accounts[5] = AccountMeta(buyer_ata, is_signer=am["isSigner"], is_writable=am["isWritable"])
+            if len(cloned_accounts) > 6 and account_metas_clone[6]["isSigner"]:
+                cloned_accounts[6] = AccountMeta(buyer, is_signer=True, is_writable=account_metas_clone[6]["isWritable"])
+            logger.info("CLONE: buyer_ata[5]=%.12s... signer[6]=%.12s...", buyer_ata, self._pubkey_str)
 
             # Build the cloned buy instruction
             buy_ix = Instruction(PUMP_FUN_PROGRAM, data, cloned_accounts)
 
             # Build complete transaction
             ixs = [
-                set_compute_unit_limit(200_000),
-                set_compute_unit_price(500_000),
-                build_create_ata_idempotent(buyer, buyer, mint, tp),
+                _CU_LIMIT_IX,
+                _CU_PRICE_IX,
+                build_create_ata_idempotent(buyer, buyer, mint, tp, ata=buyer_ata),
                 buy_ix,  # CLONED instruction
             ]
 
-            if self.jito_tip_account:
-                tip_lamports = int(self.tip_amount_sol * 1e9)
-                tip_ix = transfer(TransferParams(
-                    from_pubkey=buyer,
-                    to_pubkey=Pubkey.from_string(self.jito_tip_account),
-                    lamports=tip_lamports
-                ))
+            tip_ix = self._tip_instruction()
+            if tip_ix is not None:
                 ixs.append(tip_ix)
 
-            recent_hash = Hash.from_string(blockhash_ctx["blockhash"])
+            recent_hash = blockhash_ctx.get("blockhash_parsed") or Hash.from_string(blockhash_ctx["blockhash"])
             msg = Message.new_with_blockhash(ixs, buyer, recent_hash)
             tx = Transaction.new_unsigned(msg)
             tx.sign([self._keypair], recent_hash)
 
             tx_bytes = bytes(tx)
-            import base64
-            tx_b64 = base64.b64encode(tx_bytes).decode()
 
-            logger.info(f"Built CLONED buy TX for mint={mint_str[:8]}... amount={buy_amount_sol} SOL (Clone & Inject)")
+            logger.info("Built CLONED buy TX for mint=%.8s... amount=%s SOL (Clone & Inject)", mint_str, buy_amount_sol)
             return {
                 "tx_bytes": tx_bytes,
-                "tx_base64": tx_b64,
                 "mint": mint_str,
-                "buyer": str(buyer),
+                "buyer": self._pubkey_str,
                 "buyer_ata": str(buyer_ata),
                 "amount_sol": buy_amount_sol,
                 "blockhash": blockhash_ctx["blockhash"],
@@ -386,47 +814,42 @@ class SolanaTrader:
             tp = TOKEN_PROGRAM
 
         try:
-            mint = Pubkey.from_string(mint_str)
-            bonding_curve = Pubkey.from_string(bonding_curve_str)
-            assoc_bc = Pubkey.from_string(assoc_bonding_curve_str)
-            buyer = self._keypair.pubkey()
+            mint = _pk(mint_str)
+            bonding_curve = _pk(bonding_curve_str)
+            assoc_bc = _pk(assoc_bonding_curve_str)
+            buyer = self._pubkey
             buyer_ata = get_associated_token_address(buyer, mint, tp)
 
             # Get creator for creator_vault derivation
             creator = None
             if creator_str:
-                creator = Pubkey.from_string(creator_str)
+                creator = _pk(creator_str)
             else:
                 creator = await self.fetch_bonding_curve_creator(bonding_curve_str)
 
             if not blockhash_ctx:
-                blockhash_ctx = await self.get_latest_blockhash()
+                blockhash_ctx = await self._get_blockhash_ctx()
             if not blockhash_ctx or not blockhash_ctx.get("blockhash"):
                 logger.error("Failed to get blockhash")
                 return None
 
             # Derive creator_vault PDA
             if creator:
-                creator_vault, _ = Pubkey.find_program_address(
-                    [b"creator-vault", bytes(creator)], PUMP_FUN_PROGRAM
-                )
+                creator_vault = _creator_vault(bytes(creator))
             else:
                 logger.error("No creator available for creator_vault derivation")
                 return None
 
-            # Derive user_volume_accumulator PDA
-            user_volume_acc, _ = Pubkey.find_program_address(
-                [b"user_volume_accumulator", bytes(buyer)], PUMP_FUN_PROGRAM
-            )
+            user_volume_acc = self._user_volume_acc
 
             max_sol_lamports = int(buy_amount_sol * 1e9)
             token_amount = int(max_sol_lamports * 30)
             max_sol_with_slippage = int(max_sol_lamports * (1 + slippage_pct / 100))
 
             ixs = [
-                set_compute_unit_limit(200_000),
-                set_compute_unit_price(500_000),
-                build_create_ata_idempotent(buyer, buyer, mint, tp),
+                _CU_LIMIT_IX,
+                _CU_PRICE_IX,
+                build_create_ata_idempotent(buyer, buyer, mint, tp, ata=buyer_ata),
                 build_buy_instruction(
                     buyer, mint, bonding_curve, assoc_bc, buyer_ata,
                     token_amount, max_sol_with_slippage,
@@ -434,30 +857,22 @@ class SolanaTrader:
                 ),
             ]
 
-            if self.jito_tip_account:
-                tip_lamports = int(self.tip_amount_sol * 1e9)
-                tip_ix = transfer(TransferParams(
-                    from_pubkey=buyer,
-                    to_pubkey=Pubkey.from_string(self.jito_tip_account),
-                    lamports=tip_lamports
-                ))
+            tip_ix = self._tip_instruction()
+            if tip_ix is not None:
                 ixs.append(tip_ix)
 
-            recent_hash = Hash.from_string(blockhash_ctx["blockhash"])
+            recent_hash = blockhash_ctx.get("blockhash_parsed") or Hash.from_string(blockhash_ctx["blockhash"])
             msg = Message.new_with_blockhash(ixs, buyer, recent_hash)
             tx = Transaction.new_unsigned(msg)
             tx.sign([self._keypair], recent_hash)
 
             tx_bytes = bytes(tx)
-            import base64
-            tx_b64 = base64.b64encode(tx_bytes).decode()
 
-            logger.info(f"Built buy TX for mint={mint_str[:8]}... amount={buy_amount_sol} SOL tip={self.tip_amount_sol}")
+            logger.info("Built buy TX for mint=%.8s... amount=%s SOL tip=%s", mint_str, buy_amount_sol, self.tip_amount_sol)
             return {
                 "tx_bytes": tx_bytes,
-                "tx_base64": tx_b64,
                 "mint": mint_str,
-                "buyer": str(buyer),
+                "buyer": self._pubkey_str,
                 "buyer_ata": str(buyer_ata),
                 "amount_sol": buy_amount_sol,
                 "blockhash": blockhash_ctx["blockhash"],
@@ -468,35 +883,27 @@ class SolanaTrader:
             logger.error(f"build_buy_transaction failed: {e}")
             return None
 
-    async def send_transaction(self, tx_b64: str, rpc_url: str = None) -> Dict:
-        url = self.jito_url if self.jito_url else rpc_url
-        if not url:
-            ep = self.rpc_manager.get_tx_fetch_connection()
-            url = ep.url if ep else None
-        if not url:
-            return {"signature": None, "error": "rpc_unavailable", "error_type": "rpc_unavailable", "error_expected": False}
+    def _send_urls(self, rpc_url: str = None) -> List[str]:
+        urls = [self.jito_url, rpc_url] + self.rpc_manager.get_all_send_connections(RPC_SEND_FANOUT)
+        return [url for url in dict.fromkeys(urls) if url]
 
+    async def _post_send(self, url: str, body: bytes) -> Optional[Dict]:
+        """One sendTransaction POST; None when the endpoint's circuit is open and it was skipped."""
         try:
-            async with aiohttp.ClientSession() as session:
-                payload = {
-                    "jsonrpc": "2.0", "id": 1, "method": "sendTransaction",
-                    "params": [tx_b64, {"encoding": "base64", "skipPreflight": True,
-                                        "preflightCommitment": "processed",
-                                        "maxRetries": 0}]
-                }
-                async with session.post(url, json=payload, timeout=aiohttp.ClientTimeout(total=10)) as resp:
-                    data = await resp.json()
-                    if "result" in data:
-                        sig = data["result"]
-                        return {"signature": sig, "error": None, "error_type": None, "error_expected": False}
-                    err = data.get("error", {})
-                    classified = TxErrorClassifier.classify(err)
-                    return {
-                        "signature": None,
-                        "error": err,
-                        "error_type": classified["type"],
-                        "error_expected": classified["expected"]
-                    }
+            data = await self._rpc_post(url, body, 10)
+            if "result" in data:
+                sig = data["result"]
+                return {"signature": sig, "error": None, "error_type": None, "error_expected": False}
+            err = data.get("error", {})
+            classified = TxErrorClassifier.classify(err)
+            return {
+                "signature": None,
+                "error": err,
+                "error_type": classified["type"],
+                "error_expected": classified["expected"]
+            }
+        except CircuitOpen:
+            return None
         except Exception as e:
             classified = TxErrorClassifier.classify(str(e))
             return {
@@ -506,6 +913,39 @@ class SolanaTrader:
                 "error_expected": classified["expected"]
             }
 
+    async def send_transaction(self, tx_bytes: bytes, rpc_url: str = None) -> Dict:
+        """Fan the signed TX out to Jito + top RPCs; the first signature wins."""
+        urls = self._send_urls(rpc_url)
+        if not urls:
+            return {"signature": None, "error": "rpc_unavailable", "error_type": "rpc_unavailable", "error_expected": False}
+
+        # Encode and serialise once, at the payload site - builders hand over raw bytes
+        body = _SEND_TX_TEMPLATE % _b64encode(tx_bytes)
+        tasks = [asyncio.create_task(self._post_send(url, body)) for url in urls]
+        first_error = None
+        try:
+            for fut in asyncio.as_completed(tasks):
+                result = await fut
+                if result is None:
+                    continue
+                if result["signature"]:
+                    return result
+                logger.debug("sendTransaction rejected: type=%s error=%s", result["error_type"], result["error"])
+                if result["error_type"] == "blockhash_not_found":
+                    # The cached hash has expired on-chain; drop it and start the refetch now
+                    self._bh_cache = None
+                    self._blockhash_fetch()
+                if first_error is None:
+                    first_error = result
+        finally:
+            # Same signed TX everywhere - the cluster dedups by signature
+            for task in tasks:
+                task.cancel()
+        if first_error is None:
+            # Every endpoint was skipped with its circuit open
+            return {"signature": None, "error": "rpc_unavailable", "error_type": "rpc_unavailable", "error_expected": False}
+        return first_error
+
     async def wait_for_bonding_curve_init(self, bonding_curve_str: str, timeout_sec: float = 8.0) -> bool:
         """Single-shot bonding_curve readiness check (fail fast)."""
         rpcs = self._select_rpcs()
@@ -515,25 +955,26 @@ class SolanaTrader:
 
         url = rpcs[0]
         try:
-            async with aiohttp.ClientSession() as session:
-                payload = {
-                    "jsonrpc": "2.0", "id": 1, "method": "getAccountInfo",
-                    "params": [bonding_curve_str, {"encoding": "base64", "commitment": "confirmed"}]
-                }
-                async with session.post(url, json=payload, timeout=aiohttp.ClientTimeout(total=3)) as resp:
-                    data = await resp.json()
-                    if "error" in data:
-                        err_code = data["error"].get("code", 0) if isinstance(data["error"], dict) else 0
-                        if err_code == -32401:
-                            self.rpc_manager.mark_auth_failure(url)
-                        return False
-
-                    value = data.get("result", {}).get("value")
-                    if not value:
-                        return False
-
-                    owner = value.get("owner")
-                    return owner == str(PUMP_FUN_PROGRAM)
+            payload = {
+                "jsonrpc": "2.0", "id": 1, "method": "getAccountInfo",
+                "params": [bonding_curve_str, {"encoding": "base64", "commitment": "confirmed"}]
+            }
+            raw = await self._rpc_post(url, orjson.dumps(payload), 3, raw=True)
+            if _PUMP_FUN_OWNER_BYTES in raw:
+                return True
+            data = orjson.loads(raw)
+            if "error" in data:
+                err_code = data["error"].get("code", 0) if isinstance(data["error"], dict) else 0
+                if err_code == -32401:
+                    self.rpc_manager.mark_auth_failure(url)
+                return False
+
+            value = data.get("result", {}).get("value")
+            if not value:
+                return False
+
+            owner = value.get("owner")
+            return owner == PUMP_FUN_PROGRAM_STR
         except Exception:
             return False
 
@@ -547,90 +988,100 @@ class SolanaTrader:
         mint_str = parsed_create_data.get("mint", "")
         bonding_curve_str = parsed_create_data.get("bonding_curve", "")
         
-        logger.info(f"execute_buy_cloned (Clone & Inject): mint={mint_str[:12]}... amount={buy_amount_sol} SOL")
-        try:
-            if not self._keypair:
-                if not self.load_keypair_from_wallet():
+        logger.info("execute_buy_cloned (Clone & Inject): mint=%.12s... amount=%s SOL", mint_str, buy_amount_sol)
+        shed = self._buys_saturated()
+        if shed:
+            return shed
+        async with self._buy_sem:
+            try:
+                if not self._keypair:
+                    if not self.load_keypair_from_wallet():
+                        return {
+                            "success": False,
+                            "error": "Wallet locked - unlock in Setup",
+                            "error_type": "wallet_locked",
+                            "error_expected": True
+                        }
+
+                try:
+                    buy_amount_sol = float(buy_amount_sol)
+                except Exception:
+                    buy_amount_sol = 0.0
+                if buy_amount_sol <= 0:
                     return {
                         "success": False,
-                        "error": "Wallet locked - unlock in Setup",
-                        "error_type": "wallet_locked",
+                        "error": "Invalid buy amount",
+                        "error_type": "invalid_buy_amount",
                         "error_expected": True
                     }
 
-            try:
-                buy_amount_sol = float(buy_amount_sol)
-            except Exception:
-                buy_amount_sol = 0.0
-            if buy_amount_sol <= 0:
-                return {
-                    "success": False,
-                    "error": "Invalid buy amount",
-                    "error_type": "invalid_buy_amount",
-                    "error_expected": True
-                }
-
-            bc_ready = await self.wait_for_bonding_curve_init(bonding_curve_str, timeout_sec=0.0)
-            if not bc_ready:
-                return {
-                    "success": False,
-                    "error": "Bonding curve not ready",
-                    "error_type": "bonding_curve_not_ready",
-                    "error_expected": True
-                }
-            
-            blockhash_ctx = await self.get_latest_blockhash()
-            if not blockhash_ctx:
-                return {"success": False, "error": "Failed to get blockhash"}
-
-            # Use Clone & Inject instead of reconstruction
-            tx_data = await self.clone_and_inject_buy_transaction(
-                parsed_create_data, buy_amount_sol, slippage_pct, blockhash_ctx
-            )
-            if not tx_data:
-                return {
-                    "success": False,
-                    "error": "Failed to clone & inject TX",
-                    "error_type": "clone_inject_failed",
-                    "error_expected": False
-                }
+                # Build while the curve check is in flight; only send once it confirms
+                bc_check = asyncio.create_task(self.wait_for_bonding_curve_init(bonding_curve_str, timeout_sec=0.0))
+                try:
+                    blockhash_ctx = await self._get_blockhash_ctx()
+                    tx_data = None
+                    if blockhash_ctx:
+                        # Use Clone & Inject instead of reconstruction
+                        tx_data = await self.clone_and_inject_buy_transaction(
+                            parsed_create_data, buy_amount_sol, slippage_pct, blockhash_ctx
+                        )
+                    bc_ready = await bc_check
+                finally:
+                    bc_check.cancel()
+
+                if not bc_ready:
+                    return {
+                        "success": False,
+                        "error": "Bonding curve not ready",
+                        "error_type": "bonding_curve_not_ready",
+                        "error_expected": True
+                    }
+                if not blockhash_ctx:
+                    return {"success": False, "error": "Failed to get blockhash"}
+                if not tx_data:
+                    return {
+                        "success": False,
+                        "error": "Failed to clone & inject TX",
+                        "error_type": "clone_inject_failed",
+                        "error_expected": False
+                    }
 
-            send_result = await self.send_transaction(tx_data["tx_base64"])
-            latency = (time.time() - start) * 1000
+                send_result = await self.send_transaction(tx_data["tx_bytes"])
+                latency = (time.time() - start) * 1000
 
-            if send_result.get("signature"):
-                sig = send_result["signature"]
-                verification = await self.verify_transaction_onchain(sig, mint_str, max_wait=0)
-                if verification.get("confirmed") and not verification.get("success", True):
+                if send_result.get("signature"):
+                    sig = send_result["signature"]
+                    verification = await self.verify_transaction_onchain(sig, mint_str, max_wait=0)
+                    if verification.get("confirmed") and not verification.get("success", True):
+                        return {
+                            "success": False,
+                            "signature": sig,
+                            "latency_ms": latency,
+                            "mint": mint_str,
+                            "amount_sol": buy_amount_sol,
+                            "error": verification.get("error"),
+                            "error_type": verification.get("error_type"),
+                            "error_expected": verification.get("error_expected", False),
+                            "verification": verification,
+                        }
                     return {
-                        "success": False,
-                        "signature": sig,
-                        "latency_ms": latency,
-                        "mint": mint_str,
+                        "success": True, "signature": sig,
+                        "latency_ms": latency, "mint": mint_str,
                         "amount_sol": buy_amount_sol,
-                        "error": verification.get("error"),
-                        "error_type": verification.get("error_type"),
-                        "error_expected": verification.get("error_expected", False),
+                        "entry_price_sol": buy_amount_sol,
                         "verification": verification,
                     }
                 return {
-                    "success": True, "signature": sig,
-                    "latency_ms": latency, "mint": mint_str,
-                    "amount_sol": buy_amount_sol,
-                    "entry_price_sol": buy_amount_sol,
-                    "verification": verification,
+                    "success": False,
+                    "error": send_result.get("error"),
+                    "error_type": send_result.get("error_type"),
+                    "error_expected": send_result.get("error_expected", False),
+                    "latency_ms": latency
                 }
-            return {
-                "success": False,
-                "error": send_result.get("error"),
-                "error_type": send_result.get("error_type"),
-                "error_expected": send_result.get("error_expected", False),
-                "latency_ms": latency
-            }
 
-        except Exception as e:
-            logger.error(f"execute_buy_cloned failed: {e}", exc_info=True)
-            return {"success": False, "error": str(e), "latency_ms": (time.time() - start) * 1000}
+            except Exception as e:
+                logger.error(f"execute_buy_cloned failed: {e}", exc_info=True)
+                return {"success": False, "error": str(e), "latency_ms": (time.time() - start) * 1000}
 
 
     async def execute_buy(
@@ -641,258 +1092,191 @@ class SolanaTrader:
     ) -> Dict:
         start = time.time()
         tp_label = "T22" if (not token_program_str or token_program_str == TOKEN_2022_PROGRAM_STR) else "SPL"
-        logger.info(f"execute_buy: mint={mint_str[:12]}... amount={buy_amount_sol} SOL token_program={tp_label}")
-        try:
-            if not self._keypair:
-                if not self.load_keypair_from_wallet():
+        logger.info("execute_buy: mint=%.12s... amount=%s SOL token_program=%s", mint_str, buy_amount_sol, tp_label)
+        shed = self._buys_saturated()
+        if shed:
+            return shed
+        async with self._buy_sem:
+            try:
+                if not self._keypair:
+                    if not self.load_keypair_from_wallet():
+                        return {
+                            "success": False,
+                            "error": "Wallet locked - unlock in Setup",
+                            "error_type": "wallet_locked",
+                            "error_expected": True
+                        }
+
+                try:
+                    buy_amount_sol = float(buy_amount_sol)
+                except Exception:
+                    buy_amount_sol = 0.0
+                if buy_amount_sol <= 0:
                     return {
                         "success": False,
-                        "error": "Wallet locked - unlock in Setup",
-                        "error_type": "wallet_locked",
+                        "error": "Invalid buy amount",
+                        "error_type": "invalid_buy_amount",
                         "error_expected": True
                     }
 
-            try:
-                buy_amount_sol = float(buy_amount_sol)
-            except Exception:
-                buy_amount_sol = 0.0
-            if buy_amount_sol <= 0:
-                return {
-                    "success": False,
-                    "error": "Invalid buy amount",
-                    "error_type": "invalid_buy_amount",
-                    "error_expected": True
-                }
+                # Build while the curve check is in flight; only send once it confirms
+                bc_check = asyncio.create_task(self.wait_for_bonding_curve_init(bonding_curve_str, timeout_sec=0.0))
+                try:
+                    if creator_str:
+                        blockhash_ctx = await self._get_blockhash_ctx()
+                    else:
+                        # The creator lookup is its own RPC round-trip; overlap it with the blockhash
+                        blockhash_ctx, creator = await asyncio.gather(
+                            self._get_blockhash_ctx(), self.fetch_bonding_curve_creator(bonding_curve_str)
+                        )
+                        if creator:
+                            creator_str = str(creator)
+                        else:
+                            # build_buy_transaction would only repeat the failed lookup
+                            logger.error("No creator available for creator_vault derivation")
+                    tx_data = None
+                    if blockhash_ctx and creator_str:
+                        tx_data = await self.build_buy_transaction(
+                            mint_str, bonding_curve_str, assoc_bonding_curve_str,
+                            buy_amount_sol, slippage_pct, blockhash_ctx, token_program_str,
+                            creator_str
+                        )
+                    bc_ready = await bc_check
+                finally:
+                    bc_check.cancel()
+
+                if not bc_ready:
+                    return {
+                        "success": False,
+                        "error": "Bonding curve not ready",
+                        "error_type": "bonding_curve_not_ready",
+                        "error_expected": True
+                    }
+                if not blockhash_ctx:
+                    return {"success": False, "error": "Failed to get blockhash"}
+                if not tx_data:
+                    return {"success": False, "error": "Failed to build TX"}
+
+                send_result = await self.send_transaction(tx_data["tx_bytes"])
+                latency = (time.time() - start) * 1000
 
-            bc_ready = await self.wait_for_bonding_curve_init(bonding_curve_str, timeout_sec=0.0)
-            if not bc_ready:
+                if send_result.get("signature"):
+                    sig = send_result["signature"]
+                    return {
+                        "success": True, "signature": sig,
+                        "latency_ms": latency, "mint": mint_str,
+                        "amount_sol": buy_amount_sol,
+                        "entry_price_sol": buy_amount_sol,
+                    }
                 return {
                     "success": False,
-                    "error": "Bonding curve not ready",
-                    "error_type": "bonding_curve_not_ready",
-                    "error_expected": True
+                    "error": send_result.get("error"),
+                    "error_type": send_result.get("error_type"),
+                    "error_expected": send_result.get("error_expected", False),
+                    "latency_ms": latency
                 }
-            
-            blockhash_ctx = await self.get_latest_blockhash()
-            if not blockhash_ctx:
-                return {"success": False, "error": "Failed to get blockhash"}
 
-            tx_data = await self.build_buy_transaction(
-                mint_str, bonding_curve_str, assoc_bonding_curve_str,
-                buy_amount_sol, slippage_pct, blockhash_ctx, token_program_str,
-                creator_str
+            except Exception as e:
+                logger.error(f"execute_buy failed: {e}", exc_info=True)
+                return {"success": False, "error": str(e), "latency_ms": (time.time() - start) * 1000}
+
+    async def _parse_tx_response(self, url: str, signature: str, data: Dict) -> Tuple[Optional[Dict], Optional[str]]:
+        if "error" in data:
+            err_code = data["error"].get("code", 0) if isinstance(data["error"], dict) else 0
+            err_msg = data["error"].get("message", "") if isinstance(data["error"], dict) else str(data["error"])
+            if err_code == -32401:
+                self.rpc_manager.mark_auth_failure(url)
+                return None, "rpc_auth"
+            if err_code == -32003 or "daily request limit" in err_msg.lower():
+                self.rpc_manager.mark_rate_limit(url)
+                return None, "rpc_rate_limit"
+            err_type = TxErrorClassifier.classify(data["error"])["type"]
+            if err_type in _TERMINAL_RPC_ERRORS:
+                return None, f"rpc_{err_type}"
+            return None, "rpc_error"
+        tx_data = data.get("result")
+        if not tx_data:
+            return None, "tx_null"
+        if isinstance(tx_data.get("transaction"), list):
+            try:
+                tx_data = _decode_base64_tx(tx_data)
+            except Exception as e:
+                logger.debug("base64 TX decode failed for %.16s...: %s", signature, e)
+                return None, "tx_decode_failed"
+        account_keys = tx_data.get("transaction", {}).get("message", {}).get("accountKeys", ())
+        if len(account_keys) > PARSE_OFFLOAD_MIN_KEYS:
+            # Large TXs take ms of pure-Python walking; keep the loop free for sends
+            parsed, reason = await asyncio.get_running_loop().run_in_executor(
+                self._parse_pool, self._extract_pump_accounts, tx_data
             )
-            if not tx_data:
-                return {"success": False, "error": "Failed to build TX"}
-
-            send_result = await self.send_transaction(tx_data["tx_base64"])
-            latency = (time.time() - start) * 1000
-
-            if send_result.get("signature"):
-                sig = send_result["signature"]
-                return {
-                    "success": True, "signature": sig,
-                    "latency_ms": latency, "mint": mint_str,
-                    "amount_sol": buy_amount_sol,
-                    "entry_price_sol": buy_amount_sol,
-                }
-            return {
-                "success": False,
-                "error": send_result.get("error"),
-                "error_type": send_result.get("error_type"),
-                "error_expected": send_result.get("error_expected", False),
-                "latency_ms": latency
-            }
-
-        except Exception as e:
-            logger.error(f"execute_buy failed: {e}", exc_info=True)
-            return {"success": False, "error": str(e), "latency_ms": (time.time() - start) * 1000}
-
-    async def fetch_and_parse_tx(self, signature: str, rpc_url: str = None) -> Tuple[Optional[Dict], Optional[str]]:
-        rpcs = []
-        if rpc_url:
-            rpcs.append(rpc_url)
-        for ep in self.rpc_manager.get_all_available_rpcs():
-            if ep.url not in rpcs:
-                rpcs.append(ep.url)
-        non_helius = [u for u in rpcs if "helius-rpc.com" not in u]
-        if non_helius:
-            rpcs = non_helius
-        rpcs = sorted(rpcs, key=lambda u: 0 if "extrnode" in u else 1)
-        if not rpcs:
-            return None, "rpc_unavailable"
-
-        url = rpcs[0]
+        else:
+            parsed, reason = self._extract_pump_accounts(tx_data)
+        if parsed:
+            logger.info("Parsed TX %.16s... mint=%.12s...", signature, parsed["mint"])
+        return parsed, reason
+
+    async def _fetch_tx_one(
+        self, url: str, signature: str, timeout: float = 5.0, template: bytes = _GET_TX_TEMPLATE
+    ) -> Optional[Tuple[Optional[Dict], Optional[str]]]:
+        """One getTransaction POST; None when the endpoint's circuit is open and it was skipped."""
         try:
-            async with aiohttp.ClientSession() as session:
-                payload = {
-                    "jsonrpc": "2.0", "id": 1, "method": "getTransaction",
-                    "params": [signature, {"encoding": "jsonParsed", "commitment": "confirmed",
-                                           "maxSupportedTransactionVersion": 0}]
-                }
-                async with session.post(url, json=payload, timeout=aiohttp.ClientTimeout(total=5)) as resp:
-                    data = await resp.json()
-                    if "error" in data:
-                        err_code = data["error"].get("code", 0) if isinstance(data["error"], dict) else 0
-                        err_msg = data["error"].get("message", "") if isinstance(data["error"], dict) else str(data["error"])
-                        if err_code == -32401:
-                            self.rpc_manager.mark_auth_failure(url)
-                            return None, "rpc_auth"
-                        if err_code == -32003 or "daily request limit" in err_msg.lower():
-                            self.rpc_manager.mark_rate_limit(url)
-                            return None, "rpc_rate_limit"
-                        return None, "rpc_error"
-                    tx_data = data.get("result")
-                    if not tx_data:
-                        return None, "tx_null"
-                    parsed, reason = self._extract_pump_accounts(tx_data)
-                    if parsed:
-                        logger.info(f"Parsed TX {signature[:16]}... mint={parsed['mint'][:12]}...")
-                    return parsed, reason
+            data = await self._rpc_post(url, template % (1, signature.encode()), timeout)
+            result = await self._parse_tx_response(url, signature, data)
+        except CircuitOpen:
+            return None
         except Exception:
             return None, "rpc_exception"
-
-    def _extract_pump_accounts(self, tx_data: Dict) -> Tuple[Optional[Dict], Optional[str]]:
+        if result[1] == "tx_decode_failed" and template is not _GET_TX_PARSED_TEMPLATE:
+            return await self._fetch_tx_one(url, signature, timeout, _GET_TX_PARSED_TEMPLATE)
+        return result
+
+    async def _race_tx_fetch(
+        self, rpcs: List[str], signature: str, timeout: float
+    ) -> Tuple[Tuple[Optional[Dict], Optional[str]], bool]:
+        """One round of getTransaction across the top RPCs. Returns (result, definitive)."""
+        tasks = [asyncio.create_task(self._fetch_tx_one(url, signature, timeout)) for url in rpcs[:RPC_RACE_FANOUT]]
+        first_miss = None
         try:
-            meta = tx_data.get("meta")
-            if meta is None:
-                return None, "tx_meta_null"
-            if meta.get("err"):
-                return None, "tx_meta_err"
-
-            tx_msg = tx_data.get("transaction", {}).get("message", {})
-            account_keys = tx_msg.get("accountKeys", [])
-            if not account_keys:
-                return None, "no_account_keys"
-
-            keys_list = []
-            for ak in account_keys:
-                if isinstance(ak, dict):
-                    keys_list.append(ak.get("pubkey", ""))
-                else:
-                    keys_list.append(str(ak))
-
-            logs = meta.get("logMessages", [])
-            if not any("Instruction: Create" in line or "InitializeMint" in line for line in logs):
-                return None, "no_create_discriminator"
-
-            # Detect which token program is used in this transaction
-            token_program_str = TOKEN_2022_PROGRAM_STR  # default to Token-2022
-            if TOKEN_PROGRAM_STR in keys_list and TOKEN_2022_PROGRAM_STR not in keys_list:
-                token_program_str = TOKEN_PROGRAM_STR
-
-            instructions = tx_msg.get("instructions", [])
-            pump_ix = None
-            for ix in instructions:
-                prog = ix.get("programId", "")
-                if prog == str(PUMP_FUN_PROGRAM):
-                    pump_ix = ix
-                    break
-
-            if not pump_ix:
-                inner = meta.get("innerInstructions", [])
-                for inner_group in inner:
-                    for ix in inner_group.get("instructions", []):
-                        if ix.get("programId", "") == str(PUMP_FUN_PROGRAM):
-                            pump_ix = ix
-                            break
-
-            if not pump_ix:
-                return None, "no_pump_instruction"
-
-            ix_accounts = pump_ix.get("accounts", [])
-            post_balances = meta.get("postTokenBalances", [])
-            if not post_balances:
-                return None, "no_post_token_balances"
-
-            mint = None
-            bonding_curve = None
-            assoc_bonding_curve = None
-
-            for ptb in post_balances:
-                m = ptb.get("mint", "")
-                owner = ptb.get("owner", "")
-                if m and owner:
-                    mint = m
-                    break
-
-            if len(ix_accounts) >= 5:
-                if not mint:
-                    mint = ix_accounts[2] if len(ix_accounts) > 2 else None
-                bonding_curve = ix_accounts[3] if len(ix_accounts) > 3 else None
-                assoc_bonding_curve = ix_accounts[4] if len(ix_accounts) > 4 else None
-
-            if mint and bonding_curve:
-                # Extract creator from tx signers (first signer that isn't the mint)
-                creator = None
-                for k in keys_list:
-                    ak_entry = None
-                    for raw_ak in account_keys:
-                        pk = raw_ak.get("pubkey", "") if isinstance(raw_ak, dict) else str(raw_ak)
-                        if pk == k:
-                            ak_entry = raw_ak
-                            break
-                    if isinstance(ak_entry, dict) and ak_entry.get("signer") and k != mint:
-                        creator = k
-                        break
-
-                logger.info(f"Extracted: mint={mint[:12]}... creator={creator[:12] if creator else 'None'}... tp={'T22' if token_program_str == TOKEN_2022_PROGRAM_STR else 'SPL'}")
-                
-                # Build complete account metas list for cloning
-                account_metas_for_clone = []
-                for idx in ix_accounts:
-                    pubkey_str = ""
-                    is_signer = False
-                    is_writable = False
-
-                    if isinstance(idx, int):
-                        if idx < len(account_keys):
-                            ak = account_keys[idx]
-                            pubkey_str = ak.get("pubkey", "") if isinstance(ak, dict) else str(ak)
-                            is_signer = ak.get("signer", False) if isinstance(ak, dict) else False
-                            is_writable = ak.get("writable", False) if isinstance(ak, dict) else False
-                    elif isinstance(idx, dict):
-                        pubkey_str = idx.get("pubkey", "")
-                        is_signer = idx.get("signer", False)
-                        is_writable = idx.get("writable", False)
-                    else:
-                        pubkey_str = str(idx)
-                        for ak in account_keys:
-                            ak_pubkey = ak.get("pubkey", "") if isinstance(ak, dict) else str(ak)
-                            if ak_pubkey == pubkey_str:
-                                if isinstance(ak, dict):
-                                    is_signer = ak.get("signer", False)
-                                    is_writable = ak.get("writable", False)
-                                break
-
-                    if pubkey_str:
-                        account_metas_for_clone.append({
-                            "pubkey": pubkey_str,
-                            "isSigner": is_signer,
-                            "isWritable": is_writable
-                        })
-                
-                if not account_metas_for_clone:
-                    return None, "clone_accounts_empty"
-
-                return {
-                    "mint": mint,
-                    "bonding_curve": bonding_curve,
-                    "associated_bonding_curve": assoc_bonding_curve or "",
-                    "token_program": token_program_str,
-                    "creator": creator,
-                    "accounts": ix_accounts,
-                    "all_keys": keys_list,
-                    "instruction_data": pump_ix.get("data", ""),
-                    "account_metas_clone": account_metas_for_clone,
-                }, None
-            return None, "missing_accounts"
-
-        except Exception as e:
-            # Drop silently - exceptions during extraction are common in HFT
-            logger.debug(f"_extract_pump_accounts failed: {e}")
-            return None, "extract_exception"
-
+            for fut in asyncio.as_completed(tasks):
+                result = await fut
+                if result is None:
+                    continue
+                parsed, reason = result
+                # RPC failures and not-yet-visible TXs may still resolve on another node
+                if parsed or not (reason == "tx_null" or reason.startswith("rpc_")):
+                    return (parsed, reason), True
+                if first_miss is None or reason == "tx_null":
+                    first_miss = (parsed, reason)
+        finally:
+            for task in tasks:
+                task.cancel()
+        return first_miss or (None, "rpc_unavailable"), False
+
+    async def fetch_and_parse_tx(
+        self, signature: str, rpc_url: str = None, deadline_ms: float = TX_FETCH_DEADLINE_MS
+    ) -> Tuple[Optional[Dict], Optional[str]]:
+        """Race getTransaction across the top RPCs, retrying misses until `deadline_ms` runs out."""
+        deadline = time.monotonic() + deadline_ms / 1000
+        result = (None, "rpc_unavailable")
+        attempt = 0
+        while True:
+            rpcs = self._select_rpcs(rpc_url)
+            if not rpcs:
+                return result
+            remaining = deadline - time.monotonic()
+            # Always make one attempt, even with an already spent budget
+            timeout = min(remaining, TX_FETCH_ATTEMPT_TIMEOUT) if remaining > 0 else TX_FETCH_ATTEMPT_TIMEOUT
+            result, definitive = await self._race_tx_fetch(rpcs, signature, timeout)
+            remaining = deadline - time.monotonic()
+            if definitive or remaining <= 0 or result[1] in _TERMINAL_TX_FETCH_REASONS:
+                return result
+            # Auth-failed/rate-limited nodes are in cooldown and drop out of _select_rpcs next round
+            backoff = min(TX_FETCH_BACKOFF_BASE * 2 ** attempt, TX_FETCH_BACKOFF_MAX) * random.uniform(0.5, 1.5)
+            await asyncio.sleep(min(backoff, remaining / 2))
+            attempt += 1
+
+    # Pure dict walk, kept solders-free in _pump_parser so it can be compiled with mypyc
+    _extract_pump_accounts = staticmethod(extract_pump_accounts)
 
     async def build_sell_transaction(
         self, mint_str: str, bonding_curve_str: str,
@@ -911,79 +1295,88 @@ class SolanaTrader:
             tp = TOKEN_PROGRAM
 
         try:
-            mint = Pubkey.from_string(mint_str)
-            bonding_curve = Pubkey.from_string(bonding_curve_str)
-            assoc_bc = Pubkey.from_string(assoc_bonding_curve_str)
-            seller = self._keypair.pubkey()
-            seller_ata = get_associated_token_address(seller, mint, tp)
-
-            # Get creator for creator_vault derivation
-            creator = None
-            if creator_str:
-                creator = Pubkey.from_string(creator_str)
-            else:
-                creator = await self.fetch_bonding_curve_creator(bonding_curve_str)
+            seller = self._pubkey
+            # Accounts for a position never change between sells; only the amounts do
+            scaffold_key = (mint_str, bonding_curve_str, assoc_bonding_curve_str, tp, self._pubkey_str)
+            scaffold = self._sell_scaffold.get(scaffold_key)
+            if scaffold is None:
+                mint = _pk(mint_str)
+                seller_ata = get_associated_token_address(seller, mint, tp)
+
+                # Get creator for creator_vault derivation
+                creator = None
+                if creator_str:
+                    creator = _pk(creator_str)
+                else:
+                    creator = await self.fetch_bonding_curve_creator(bonding_curve_str)
+
+                # Derive creator_vault PDA
+                if not creator:
+                    logger.error("No creator available for creator_vault derivation")
+                    return None
+                accounts = _pump_trade_accounts(
+                    seller, mint, _pk(bonding_curve_str), _pk(assoc_bonding_curve_str), seller_ata, tp,
+                    _creator_vault(bytes(creator)), self._user_volume_acc
+                )
+                scaffold = (accounts, str(seller_ata))
+                if len(self._sell_scaffold) >= SELL_SCAFFOLD_MAX:
+                    self._sell_scaffold.pop(next(iter(self._sell_scaffold)))
+                self._sell_scaffold[scaffold_key] = scaffold
+            accounts, seller_ata_str = scaffold
 
             if not blockhash_ctx:
-                blockhash_ctx = await self.get_latest_blockhash()
+                blockhash_ctx = await self._get_blockhash_ctx()
             if not blockhash_ctx or not blockhash_ctx.get("blockhash"):
                 logger.error("Failed to get blockhash")
                 return None
 
-            # Derive creator_vault PDA
-            if creator:
-                creator_vault, _ = Pubkey.find_program_address(
-                    [b"creator-vault", bytes(creator)], PUMP_FUN_PROGRAM
-                )
-            else:
-                logger.error("No creator available for creator_vault derivation")
-                return None
-
-            # Derive user_volume_accumulator PDA
-            user_volume_acc, _ = Pubkey.find_program_address(
-                [b"user_volume_accumulator", bytes(seller)], PUMP_FUN_PROGRAM
-            )
-
             # Calculate min SOL output with slippage
-            # Estimate: token_amount / 30 (inverse of buy ratio) with slippage protection
-            estimated_sol = token_amount / 30 / 1e9
-            min_sol_lamports = int(estimated_sol * 1e9 * (1 - slippage_pct / 100))
-
-            ixs = [
-                set_compute_unit_limit(200_000),
-                set_compute_unit_price(500_000),
-                build_sell_instruction(
-                    seller, mint, bonding_curve, assoc_bc, seller_ata,
-                    token_amount, min_sol_lamports,
-                    creator_vault, user_volume_acc, tp
-                ),
-            ]
-
-            if self.jito_tip_account:
-                tip_lamports = int(self.tip_amount_sol * 1e9)
-                tip_ix = transfer(TransferParams(
-                    from_pubkey=seller,
-                    to_pubkey=Pubkey.from_string(self.jito_tip_account),
-                    lamports=tip_lamports
-                ))
-                ixs.append(tip_ix)
-
-            recent_hash = Hash.from_string(blockhash_ctx["blockhash"])
-            msg = Message.new_with_blockhash(ixs, seller, recent_hash)
-            tx = Transaction.new_unsigned(msg)
-            tx.sign([self._keypair], recent_hash)
-
-            tx_bytes = bytes(tx)
-            import base64
-            tx_b64 = base64.b64encode(tx_bytes).decode()
-
-            logger.info(f"Built sell TX for mint={mint_str[:8]}... tokens={token_amount} tip={self.tip_amount_sol}")
+            # Estimate: token_amount / 30 (inverse of buy ratio) with slippage protection, in basis points
+            min_sol_lamports = token_amount * (10_000 - round(slippage_pct * 100)) // (30 * 10_000)
+
+            data = _pack_trade_data(SELL_DISCRIMINATOR, token_amount, min_sol_lamports)
+            recent_hash = blockhash_ctx.get("blockhash_parsed") or Hash.from_string(blockhash_ctx["blockhash"])
+            tip_ix = self._tip_instruction()
+            template_key = (scaffold_key, self._tip_key if tip_ix is not None else None)
+            blockhash_bytes = bytes(recent_hash)
+            cached = self._sell_templates.get(template_key)
+            if cached is not None and cached[0] == blockhash_bytes and cached[1] == accounts:
+                # Repeat sell (e.g. a retry) on the same blockhash and accounts: patch the amounts and re-sign
+                tx_bytes = self._sign_template(cached[2], blockhash_bytes, data)
+            else:
+                # A new blockhash or account set invalidates the position's template
+                self._sell_templates.pop(template_key, None)
+
+                def compile_msg(trade_data: bytes, blockhash: Hash) -> Message:
+                    ixs = [_CU_LIMIT_IX, _CU_PRICE_IX, Instruction(PUMP_FUN_PROGRAM, trade_data, accounts)]
+                    if tip_ix is not None:
+                        ixs.append(tip_ix)
+                    return Message.new_with_blockhash(ixs, seller, blockhash)
+
+                msg = compile_msg(data, recent_hash)
+                tx = Transaction.new_unsigned(msg)
+                tx.sign([self._keypair], recent_hash)
+                tx_bytes = bytes(tx)
+
+                template = _tx_template(bytes(msg), data)
+                if template is not None:
+                    # Check the windows with other inputs: patching a different blockhash and amount into
+                    # the template must reproduce the message compiled from scratch for them
+                    probe_hash = Hash(blockhash_bytes[::-1])
+                    probe_data = _pack_trade_data(SELL_DISCRIMINATOR, token_amount + 1, min_sol_lamports + 1)
+                    if self._patch_template(template, bytes(probe_hash), probe_data) == bytes(
+                        compile_msg(probe_data, probe_hash)
+                    ):
+                        if len(self._sell_templates) >= SELL_SCAFFOLD_MAX:
+                            self._sell_templates.pop(next(iter(self._sell_templates)))
+                        self._sell_templates[template_key] = (blockhash_bytes, accounts, template)
+
+            logger.info("Built sell TX for mint=%.8s... tokens=%s tip=%s", mint_str, token_amount, self.tip_amount_sol)
             return {
                 "tx_bytes": tx_bytes,
-                "tx_base64": tx_b64,
                 "mint": mint_str,
-                "seller": str(seller),
-                "seller_ata": str(seller_ata),
+                "seller": self._pubkey_str,
+                "seller_ata": seller_ata_str,
                 "token_amount": token_amount,
                 "blockhash": blockhash_ctx["blockhash"],
                 "rpc_url": blockhash_ctx.get("rpc_url"),
@@ -1002,10 +1395,10 @@ class SolanaTrader:
         """Execute a sell transaction for pump.fun tokens."""
         start = time.time()
         tp_label = "T22" if (not token_program_str or token_program_str == TOKEN_2022_PROGRAM_STR) else "SPL"
-        logger.info(f"execute_sell: mint={mint_str[:12]}... tokens={token_amount} token_program={tp_label}")
+        logger.info("execute_sell: mint=%.12s... tokens=%s token_program=%s", mint_str, token_amount, tp_label)
         try:
             # Get latest blockhash
-            blockhash_ctx = await self.get_latest_blockhash()
+            blockhash_ctx = await self._get_blockhash_ctx()
             if not blockhash_ctx:
                 return {"success": False, "error": "Failed to get blockhash"}
 
@@ -1017,7 +1410,7 @@ class SolanaTrader:
             if not tx_data:
                 return {"success": False, "error": "Failed to build sell TX"}
 
-            send_result = await self.send_transaction(tx_data["tx_base64"])
+            send_result = await self.send_transaction(tx_data["tx_bytes"])
             latency = (time.time() - start) * 1000
 
             if send_result.get("signature"):
@@ -1048,67 +1441,61 @@ class SolanaTrader:
 
         url = rpcs[0]
         try:
-            async with aiohttp.ClientSession() as session:
-                payload = {
-                    "jsonrpc": "2.0", "id": 1, "method": "getTransaction",
-                    "params": [signature, {"encoding": "jsonParsed", "commitment": "confirmed",
-                                           "maxSupportedTransactionVersion": 0}]
+            body = _GET_TX_PARSED_TEMPLATE % (1, signature.encode())
+            data = await self._rpc_post(url, body, 5)
+            if "error" in data:
+                err_code = data["error"].get("code", 0) if isinstance(data["error"], dict) else 0
+                if err_code == -32401:
+                    self.rpc_manager.mark_auth_failure(url)
+                return {"confirmed": False, "error": data.get("error")}
+
+            tx_data = data.get("result")
+            if not tx_data:
+                return {"confirmed": False, "error": "tx_not_found"}
+
+            meta = tx_data.get("meta", {})
+            error = meta.get("err")
+            if error:
+                classified = TxErrorClassifier.classify(error)
+                return {
+                    "confirmed": True,
+                    "success": False,
+                    "error": error,
+                    "error_type": classified["type"],
+                    "error_expected": classified["expected"],
                 }
-                async with session.post(url, json=payload, timeout=aiohttp.ClientTimeout(total=5)) as resp:
-                    data = await resp.json()
-                    if "error" in data:
-                        err_code = data["error"].get("code", 0) if isinstance(data["error"], dict) else 0
-                        if err_code == -32401:
-                            self.rpc_manager.mark_auth_failure(url)
-                        return {"confirmed": False, "error": data.get("error")}
-
-                    tx_data = data.get("result")
-                    if not tx_data:
-                        return {"confirmed": False, "error": "tx_not_found"}
-
-                    meta = tx_data.get("meta", {})
-                    error = meta.get("err")
-                    if error:
-                        classified = TxErrorClassifier.classify(error)
-                        return {
-                            "confirmed": True,
-                            "success": False,
-                            "error": error,
-                            "error_type": classified["type"],
-                            "error_expected": classified["expected"],
-                        }
 
-                    post_token_balances = meta.get("postTokenBalances", [])
-                    pre_token_balances = meta.get("preTokenBalances", [])
-
-                    token_received = False
-                    token_mint = None
-                    token_amount_change = 0
-
-                    if expected_mint and post_token_balances:
-                        for post_bal in post_token_balances:
-                            mint = post_bal.get("mint")
-                            if mint == expected_mint:
-                                token_mint = mint
-                                post_amount = float(post_bal.get("uiTokenAmount", {}).get("uiAmount", 0))
-                                pre_amount = 0
-                                account_index = post_bal.get("accountIndex")
-                                for pre_bal in pre_token_balances:
-                                    if pre_bal.get("accountIndex") == account_index:
-                                        pre_amount = float(pre_bal.get("uiTokenAmount", {}).get("uiAmount", 0))
-                                        break
-                                token_amount_change = post_amount - pre_amount
-                                token_received = token_amount_change > 0
+            post_token_balances = meta.get("postTokenBalances", [])
+            pre_token_balances = meta.get("preTokenBalances", [])
+
+            token_received = False
+            token_mint = None
+            token_amount_change = 0
+
+            if expected_mint and post_token_balances:
+                for post_bal in post_token_balances:
+                    mint = post_bal.get("mint")
+                    if mint == expected_mint:
+                        token_mint = mint
+                        post_amount = float(post_bal.get("uiTokenAmount", {}).get("uiAmount", 0))
+                        pre_amount = 0
+                        account_index = post_bal.get("accountIndex")
+                        for pre_bal in pre_token_balances:
+                            if pre_bal.get("accountIndex") == account_index:
+                                pre_amount = float(pre_bal.get("uiTokenAmount", {}).get("uiAmount", 0))
                                 break
+                        token_amount_change = post_amount - pre_amount
+                        token_received = token_amount_change > 0
+                        break
 
-                    return {
-                        "confirmed": True,
-                        "success": True,
-                        "token_received": token_received,
-                        "token_mint": token_mint,
-                        "token_amount_change": token_amount_change,
-                        "block_time": tx_data.get("blockTime"),
-                    }
+            return {
+                "confirmed": True,
+                "success": True,
+                "token_received": token_received,
+                "token_mint": token_mint,
+                "token_amount_change": token_amount_change,
+                "block_time": tx_data.get("blockTime"),
+            }
         except Exception:
             return {"confirmed": False, "error": "rpc_exception"}
 
@@ -1,8 +1,29 @@
+import sys
 import random
 import logging
+from bisect import bisect_right
+from dataclasses import dataclass
 
 logger = logging.getLogger("strategy_engine")
 
+# Lower edges of every score bucket after the first; bisect_right gives the bucket index
+_BUCKET_EDGES = (50, 70, 85, 90)
+_BUCKET_NAMES = ("0-50", "50-70", "70-85", "85-90", "90-100")
+
+REASON_PASS = sys.intern("PASS")
+REASON_LOW_LIQUIDITY = sys.intern("LOW_LIQUIDITY")
+REASON_LOW_SCORE = sys.intern("LOW_SCORE")
+REASON_SCORE_OK = sys.intern("SCORE_OK")
+
+
+@dataclass(slots=True, frozen=True)
+class StrategyDecision:
+    passed: bool
+    pump_score: float
+    reason: str
+    buy_amount_sol: float
+    is_fast_buy: bool
+
 
 class StrategyEngine:
     def __init__(self, config: dict):
@@ -10,84 +31,101 @@ class StrategyEngine:
         self._evaluated_count = 0
         self._passed_count = 0
         self._rejected_count = 0
-        self._score_buckets = {"0-50": 0, "50-70": 0, "70-85": 0, "85-90": 0, "90-100": 0}
+        self._bucket_counts = [0] * len(_BUCKET_NAMES)
+        self._rand = random.random
+        self._cache_config()
 
     def update_config(self, config: dict):
         self.config = config
+        self._cache_config()
+
+    def _cache_config(self):
+        # Fold each weight into the (offset, span) of its uniform draw once per
+        # config change, so scoring an event is three random() calls and a few
+        # multiply-adds instead of six dict lookups and three uniform() calls.
+        scoring = self.config.get("SCORING", {})
+        weights = scoring.get("WEIGHTS", {})
+        w_rug = weights.get("RUG_CHECK", 0.25)
+        w_liq = weights.get("LIQUIDITY", 0.15)
+        w_mom = weights.get("MOMENTUM", 0.40)
+        w_creator = weights.get("CREATOR", 0.20)
+        self._w_liq = w_liq
+        self._rug_span = 55 * w_rug
+        self._mom_span = 70 * w_mom
+        self._creator_span = 70 * w_creator
+        self._base_offset = 40 * w_rug + 30 * w_mom + 20 * w_creator
+
+        thresholds = scoring.get("THRESHOLDS", {})
+        filters = self.config.get("FILTERS", {})
+        self._fast_buy_enabled = filters.get("FAST_BUY_ENABLED", True)
+        self._fast_buy_threshold = thresholds.get("FAST_BUY", 85)
+        self._min_score = thresholds.get("MIN_SCORE", 70)
+        self._min_liquidity = filters.get("MIN_LIQUIDITY_SOL", 0.5)
+        self._buy_amount = filters.get("MAX_INITIAL_BUY_AMOUNT", 0.5)
 
     def compute_pump_score(self, event_data: dict, simulation: bool = True) -> float:
         if simulation:
-            weights = self.config.get("SCORING", {}).get("WEIGHTS", {})
-            base_rug = random.uniform(40, 95) * weights.get("RUG_CHECK", 0.25)
-            base_liq = min(100, event_data.get("liquidity_sol", 1) * 40) * weights.get("LIQUIDITY", 0.15)
-            base_momentum = random.uniform(30, 100) * weights.get("MOMENTUM", 0.40)
-            base_creator = random.uniform(20, 90) * weights.get("CREATOR", 0.20)
-            score = base_rug + base_liq + base_momentum + base_creator
+            rand = self._rand
+            base_liq = min(100, event_data.get("liquidity_sol", 1) * 40) * self._w_liq
+            score = (self._base_offset + base_liq
+                     + rand() * self._rug_span
+                     + rand() * self._mom_span
+                     + rand() * self._creator_span)
             return round(min(100, max(0, score)), 1)
         return 0
 
-    async def evaluate(self, parsed_event, simulation: bool = True) -> dict:
+    def _decide(self, parsed_event, pump_score: float) -> StrategyDecision:
+        """Threshold and count one scored event."""
         self._evaluated_count += 1
-        event_data = {
-            "liquidity_sol": parsed_event.liquidity_sol,
-            "token_name": parsed_event.token_name,
-            "mint": parsed_event.mint
-        }
-
-        pump_score = self.compute_pump_score(event_data, simulation)
-
-        if pump_score < 50:
-            self._score_buckets["0-50"] += 1
-        elif pump_score < 70:
-            self._score_buckets["50-70"] += 1
-        elif pump_score < 85:
-            self._score_buckets["70-85"] += 1
-        elif pump_score < 90:
-            self._score_buckets["85-90"] += 1
-        else:
-            self._score_buckets["90-100"] += 1
-
-        thresholds = self.config.get("SCORING", {}).get("THRESHOLDS", {})
-        filters = self.config.get("FILTERS", {})
-        fast_buy_enabled = filters.get("FAST_BUY_ENABLED", True)
-        fast_buy_threshold = thresholds.get("FAST_BUY", 85)
-        min_score = thresholds.get("MIN_SCORE", 70)
-        min_liquidity = filters.get("MIN_LIQUIDITY_SOL", 0.5)
+        fast_buy_enabled = self._fast_buy_enabled
+        fast_buy_threshold = self._fast_buy_threshold
+        min_score = self._min_score
+        min_liquidity = self._min_liquidity
 
         passed = True
-        reason = "PASS"
+        reason = REASON_PASS
 
         if parsed_event.liquidity_sol < min_liquidity:
             passed = False
-            reason = f"LOW_LIQUIDITY ({parsed_event.liquidity_sol:.2f} < {min_liquidity})"
+            reason = f"{REASON_LOW_LIQUIDITY} ({parsed_event.liquidity_sol:.2f} < {min_liquidity})"
         elif fast_buy_enabled and pump_score < fast_buy_threshold:
             if pump_score < min_score:
                 passed = False
-                reason = f"LOW_SCORE ({pump_score} < {min_score})"
+                reason = f"{REASON_LOW_SCORE} ({pump_score} < {min_score})"
             else:
                 passed = True
-                reason = f"SCORE_OK ({pump_score} >= {min_score})"
+                reason = f"{REASON_SCORE_OK} ({pump_score} >= {min_score})"
 
         if passed:
             self._passed_count += 1
         else:
             self._rejected_count += 1
 
-        buy_amount = filters.get("MAX_INITIAL_BUY_AMOUNT", 0.5)
-        logger.info(f"[STRATEGY] {parsed_event.token_name} score={pump_score} liq={parsed_event.liquidity_sol:.2f} result={reason}")
+        return StrategyDecision(
+            passed=passed,
+            pump_score=pump_score,
+            reason=reason,
+            buy_amount_sol=self._buy_amount,
+            is_fast_buy=pump_score >= fast_buy_threshold and fast_buy_enabled
+        )
 
-        return {
-            "passed": passed,
-            "pump_score": pump_score,
-            "reason": reason,
-            "buy_amount_sol": buy_amount,
-            "is_fast_buy": pump_score >= fast_buy_threshold and fast_buy_enabled
+    async def evaluate(self, parsed_event, simulation: bool = True) -> StrategyDecision:
+        event_data = {
+            "liquidity_sol": parsed_event.liquidity_sol,
+            "token_name": parsed_event.token_name,
+            "mint": parsed_event.mint
         }
+        pump_score = self.compute_pump_score(event_data, simulation)
+        self._bucket_counts[bisect_right(_BUCKET_EDGES, pump_score)] += 1
+        result = self._decide(parsed_event, pump_score)
+        logger.info("[STRATEGY] %s score=%s liq=%.2f result=%s",
+                    parsed_event.token_name, pump_score, parsed_event.liquidity_sol, result.reason)
+        return result
 
     def get_stats(self) -> dict:
         return {
             "evaluated": self._evaluated_count,
             "passed": self._passed_count,
             "rejected": self._rejected_count,
-            "score_buckets": dict(self._score_buckets)
+            "score_buckets": dict(zip(_BUCKET_NAMES, self._bucket_counts))
         }
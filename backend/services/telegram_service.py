@@ -2,34 +2,61 @@ import os
 import asyncio
 import logging
 import aiohttp
-from typing import Optional
+import orjson
+from typing import Callable, Optional
+
+from config import set_nested_value
 
 logger = logging.getLogger("telegram_bot")
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+# Long-poll window for getUpdates; the client timeout leaves headroom for the reply itself
+POLL_TIMEOUT_SEC = 25
+# Commands only ever arrive as messages; ask Telegram not to send any other update type
+_ALLOWED_UPDATES = orjson.dumps(["message"]).decode()
+
 
 class TelegramService:
-    def __init__(self, bot_manager, db):
+    # Command -> handler method name, resolved per update with getattr
+    _HANDLERS = {
+        "/start": "_cmd_start",
+        "/stop": "_cmd_stop",
+        "/status": "_cmd_status",
+        "/panic": "_cmd_panic",
+        "/set": "_cmd_set",
+        "/logs": "_cmd_logs",
+        "/help": "_cmd_help",
+    }
+
+    def __init__(self, bot_manager, db, http_session: Optional[Callable[[], aiohttp.ClientSession]] = None):
         self.bot_manager = bot_manager
         self.db = db
         self.token = os.environ.get("TELEGRAM_BOT_TOKEN", "")
+        self.api_url = f"https://api.telegram.org/bot{self.token}"
+        self._send_url = f"{self.api_url}/sendMessage"
+        self._get_updates_url = f"{self.api_url}/getUpdates"
         self.chat_id = os.environ.get("TELEGRAM_CHAT_ID", "")
         self.admin_ids = set()
         if self.chat_id:
             self.admin_ids.add(str(self.chat_id))
         self._running = False
         self._session: Optional[aiohttp.ClientSession] = None
+        # Provider for a process-wide pooled session; when set, its owner closes it
+        self._shared_session = http_session
         self._offset = 0
 
-    @property
-    def api_url(self):
-        return f"https://api.telegram.org/bot{self.token}"
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._shared_session:
+            return self._shared_session()
+        if not self._session or self._session.closed:
+            self._session = aiohttp.ClientSession()
+        return self._session
 
     async def start(self):
         if not self.token:
             logger.warning("No TELEGRAM_BOT_TOKEN configured")
             return
         self._running = True
-        self._session = aiohttp.ClientSession()
         asyncio.create_task(self._poll_loop())
         logger.info("Telegram bot started polling")
 
@@ -46,11 +73,10 @@ class TelegramService:
         if not target:
             return
         try:
-            if not self._session or self._session.closed:
-                self._session = aiohttp.ClientSession()
-            async with self._session.post(f"{self.api_url}/sendMessage", json={
-                "chat_id": target, "text": text, "parse_mode": "HTML"
-            }) as resp:
+            body = orjson.dumps({"chat_id": target, "text": text, "parse_mode": "HTML"})
+            async with self._get_session().post(
+                self._send_url, data=body, headers=_JSON_HEADERS
+            ) as resp:
                 if resp.status != 200:
                     data = await resp.text()
                     logger.error(f"Telegram send failed: {resp.status} {data}")
@@ -60,18 +86,19 @@ class TelegramService:
     async def _poll_loop(self):
         while self._running:
             try:
-                if not self._session or self._session.closed:
-                    self._session = aiohttp.ClientSession()
-                async with self._session.get(
-                    f"{self.api_url}/getUpdates",
-                    params={"offset": self._offset, "timeout": 10},
-                    timeout=aiohttp.ClientTimeout(total=15)
+                async with self._get_session().get(
+                    self._get_updates_url,
+                    params={"offset": self._offset, "timeout": POLL_TIMEOUT_SEC,
+                            "allowed_updates": _ALLOWED_UPDATES},
+                    timeout=aiohttp.ClientTimeout(total=POLL_TIMEOUT_SEC + 5)
                 ) as resp:
                     if resp.status == 200:
-                        data = await resp.json()
+                        data = orjson.loads(await resp.read())
                         for update in data.get("result", []):
+                            # Always advance the offset, or a skipped update is redelivered forever
                             self._offset = update["update_id"] + 1
-                            await self._handle_update(update)
+                            if "message" in update:
+                                await self._handle_update(update)
             except asyncio.CancelledError:
                 break
             except Exception as e:
@@ -88,18 +115,9 @@ class TelegramService:
         cmd = parts[0].lower().split("@")[0]
         args = parts[1:]
 
-        handlers = {
-            "/start": self._cmd_start,
-            "/stop": self._cmd_stop,
-            "/status": self._cmd_status,
-            "/panic": self._cmd_panic,
-            "/set": self._cmd_set,
-            "/logs": self._cmd_logs,
-            "/help": self._cmd_help,
-        }
-        handler = handlers.get(cmd)
-        if handler:
-            await handler(chat_id, args)
+        handler_name = self._HANDLERS.get(cmd)
+        if handler_name:
+            await getattr(self, handler_name)(chat_id, args)
         else:
             await self.send_message(f"Unknown command: {cmd}\nUse /help", chat_id)
 
@@ -135,7 +153,6 @@ class TelegramService:
         if len(args) < 2:
             await self.send_message("Usage: /set FILTERS.MIN_LIQUIDITY_SOL 1.0", chat_id)
             return
-        from config import set_nested_value
         path, value = args[0], args[1]
         config = self.bot_manager.config
         if set_nested_value(config, path, value):
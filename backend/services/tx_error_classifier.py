@@ -1,4 +1,4 @@
-import json
+import orjson
 
 
 class TxErrorClassifier:
@@ -19,7 +19,7 @@ class TxErrorClassifier:
     def classify(error: object) -> dict:
         text = ""
         if isinstance(error, dict):
-            text = json.dumps(error)
+            text = orjson.dumps(error).decode()
         else:
             text = str(error or "")
 
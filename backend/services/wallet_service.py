@@ -1,10 +1,21 @@
+import os
 import json
 import base64
+import asyncio
+import heapq
 import hashlib
-import base58
+import operator
+try:
+    import based58 as base58  # Rust-backed, same b58encode/b58decode API
+    _NATIVE_B58 = True
+except ImportError:
+    import base58
+    _NATIVE_B58 = False
 import aiohttp
+import httpx
+import orjson
 import logging
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
@@ -13,15 +24,52 @@ from cryptography.hazmat.primitives import padding as sym_padding
 logger = logging.getLogger("wallet_service")
 
 TOKEN_PROGRAM_ID = "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA"
+RPC_FAILOVER_MAX = 4
+# How long an endpoint may stay silent before the next one is tried alongside it
+RPC_HEDGE_DELAY = 0.15
+BALANCE_TOP_TOKENS = 50
+# Same opt-in as the trader: wallet RPC POSTs multiplexed over one HTTP/2 connection per host
+RPC_HTTP2 = os.environ.get("RPC_HTTP2", "").lower() in ("1", "true", "yes")
+# Token rows are (amount, mint, decimals, ui_amount) tuples until they are returned
+_amount_getter = operator.itemgetter(0)
+_JSON_HEADERS = {"Content-Type": "application/json"}
+# Only the method name and the orjson-encoded params vary per call
+_RPC_CALL_TEMPLATE = b'{"jsonrpc":"2.0","id":1,"method":"%s","params":%s}'
+
+
+_B58_ALPHABET = b"123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+# Byte -> digit value, 0xFF for anything outside the alphabet
+_B58_LUT = bytes(_B58_ALPHABET.find(bytes([i])) & 0xFF for i in range(256))
+
+
+def _b58decode_py(s: bytes) -> bytes:
+    """Pure-Python base58 decode: one table lookup per char and a single int.to_bytes."""
+    s = s.strip()
+    acc = 0
+    lut = _B58_LUT
+    for c in s:
+        v = lut[c]
+        if v == 0xFF:
+            raise ValueError(f"Invalid base58 character {chr(c)!r}")
+        acc = acc * 58 + v
+    n_zeros = len(s) - len(s.lstrip(b"1"))
+    return b"\0" * n_zeros + acc.to_bytes((acc.bit_length() + 7) // 8, "big")
+
+
+# python-base58 converts the decoded int to bytes one divmod at a time; only based58 beats the local loop
+_b58decode = base58.b58decode if _NATIVE_B58 else _b58decode_py
 
 
 def _evp_bytes_to_key(password: bytes, salt: bytes, key_len: int = 32, iv_len: int = 16):
-    d = b''
-    d_i = b''
-    while len(d) < key_len + iv_len:
-        d_i = hashlib.md5(d_i + password + salt).digest()
+    total = key_len + iv_len
+    secret = password + salt
+    md5 = hashlib.md5
+    d_i = md5(secret).digest()
+    d = bytearray(d_i)
+    while len(d) < total:
+        d_i = md5(d_i + secret).digest()
         d += d_i
-    return d[:key_len], d[key_len:key_len + iv_len]
+    return bytes(d[:key_len]), bytes(d[key_len:total])
 
 
 def decrypt_cryptojs_aes(encrypted_b64: str, passphrase: str) -> str:
@@ -31,8 +79,7 @@ def decrypt_cryptojs_aes(encrypted_b64: str, passphrase: str) -> str:
     salt = raw[8:16]
     ciphertext = raw[16:]
     key, iv = _evp_bytes_to_key(passphrase.encode('utf-8'), salt)
-    cipher = Cipher(algorithms.AES(key), modes.CBC(iv))
-    decryptor = cipher.decryptor()
+    decryptor = Cipher(algorithms.AES(key), modes.CBC(iv)).decryptor()
     padded = decryptor.update(ciphertext) + decryptor.finalize()
     unpadder = sym_padding.PKCS7(128).unpadder()
     data = unpadder.update(padded) + unpadder.finalize()
@@ -52,6 +99,45 @@ class WalletService:
         self.rpc_manager = rpc_manager
         self._address: Optional[str] = None
         self._key_bytes: Optional[bytes] = None
+        self._http: Optional[aiohttp.ClientSession] = None
+        self._h2: Optional[httpx.AsyncClient] = None
+        self._h2_enabled = RPC_HTTP2
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Keep-alive session reused by every wallet RPC call instead of a handshake per request."""
+        if not self._http or self._http.closed:
+            self._http = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=100, limit_per_host=32, keepalive_timeout=60, ttl_dns_cache=300
+                ),
+                timeout=aiohttp.ClientTimeout(total=10),
+            )
+        return self._http
+
+    def _get_h2_client(self) -> Optional[httpx.AsyncClient]:
+        """Shared HTTP/2 client when RPC_HTTP2 is set; None means use the aiohttp session."""
+        if not self._h2_enabled:
+            return None
+        if self._h2 is None or self._h2.is_closed:
+            try:
+                self._h2 = httpx.AsyncClient(
+                    http2=True,
+                    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=60),
+                    timeout=httpx.Timeout(10.0),
+                )
+            except ImportError as e:
+                logger.warning("RPC_HTTP2 set but HTTP/2 support is unavailable, using HTTP/1.1: %s", e)
+                self._h2_enabled = False
+                return None
+        return self._h2
+
+    async def close(self):
+        if self._http:
+            await self._http.close()
+            self._http = None
+        if self._h2:
+            await self._h2.aclose()
+            self._h2 = None
 
     def decrypt_and_derive(self, encrypted_or_raw: str, passphrase: str = None) -> str:
         raw_key = encrypted_or_raw.strip()
@@ -71,7 +157,7 @@ class WalletService:
         if raw.startswith('['):
             key_bytes = bytes(json.loads(raw))
         else:
-            key_bytes = base58.b58decode(raw)
+            key_bytes = _b58decode(raw.encode())
 
         if len(key_bytes) == 64:
             seed = key_bytes[:32]
@@ -95,55 +181,142 @@ class WalletService:
         return self._address
 
     async def _rpc_call(self, method: str, params: list, rpc_url: str = None) -> dict:
-        urls = []
-        if rpc_url:
-            urls.append(rpc_url)
-        for ep in self.rpc_manager.get_all_available_rpcs():
-            if ep.url not in urls:
-                urls.append(ep.url)
+        body = _RPC_CALL_TEMPLATE % (method.encode(), orjson.dumps(params))
+        return await self._rpc_post(body, method, rpc_url)
+
+    async def _rpc_batch(self, calls: List[Tuple[str, list]], rpc_url: str = None) -> List[dict]:
+        """Send several calls as one JSON-RPC batch POST; one response dict per call, in order.
+
+        Endpoints that reject batches (no array reply) and failed elements fall back to _rpc_call.
+        """
+        body = orjson.dumps([
+            {"jsonrpc": "2.0", "id": i, "method": method, "params": params}
+            for i, (method, params) in enumerate(calls)
+        ])
+        data = await self._rpc_post(body, "batch", rpc_url)
+        if not isinstance(data, list):
+            # The calls are independent: overlap them rather than pay their latencies back to back
+            return list(await asyncio.gather(
+                *(self._rpc_call(method, params, rpc_url) for method, params in calls)
+            ))
+        by_id = {item.get("id"): item for item in data if isinstance(item, dict)}
+        results = [by_id.get(i) for i in range(len(calls))]
+        # Give failed elements the usual per-call failover across endpoints, concurrently
+        retry = [i for i, item in enumerate(results) if item is None or "error" in item]
+        if retry:
+            retried = await asyncio.gather(
+                *(self._rpc_call(calls[i][0], calls[i][1], rpc_url) for i in retry)
+            )
+            for i, item in zip(retry, retried):
+                results[i] = item
+        return results
+
+    async def _rpc_post(self, body: bytes, method: str, rpc_url: str = None):
+        # dict.fromkeys: ordered O(1) de-dup, caller's preferred URL first
+        urls = list(dict.fromkeys(
+            ([rpc_url] if rpc_url else []) + [ep.url for ep in self.rpc_manager.get_all_available_rpcs()]
+        ))
 
         if not urls:
             raise Exception("No RPC endpoint available")
 
-        payload = {"jsonrpc": "2.0", "id": 1, "method": method, "params": params}
+        client = self._get_h2_client() or self._get_session()
+        queued = iter(urls[:RPC_FAILOVER_MAX])
+        pending = set()
         last_error = None
 
-        for url in urls[:4]:
-            try:
-                async with aiohttp.ClientSession() as session:
-                    async with session.post(url, json=payload, timeout=aiohttp.ClientTimeout(total=10)) as resp:
-                        data = await resp.json()
-                        if "error" in data:
-                            error = data["error"]
-                            err_code = error.get("code", 0) if isinstance(error, dict) else 0
-                            if err_code == -32401:
-                                logger.error(f"RPC auth failure ({method}): {error} - marking RPC as failed")
-                                self.rpc_manager.mark_auth_failure(url)
-                                last_error = error
-                                continue
-                            if err_code == -32003:
-                                self.rpc_manager.mark_rate_limit(url)
-                                last_error = error
-                                continue
-                            logger.error(f"RPC error ({method}): {error}")
-                            last_error = error
-                            continue
+        def launch_next() -> None:
+            url = next(queued, None)
+            if url is not None:
+                pending.add(asyncio.create_task(self._post_one(client, url, body, method)))
+
+        # Hedged failover: the next endpoint starts as soon as one fails, or after
+        # RPC_HEDGE_DELAY while the earlier ones are still slow; the first good reply wins
+        launch_next()
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, timeout=RPC_HEDGE_DELAY, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    launch_next()
+                    continue
+                for task in done:
+                    data, error = task.result()
+                    if error is None:
                         return data
-            except Exception as e:
-                last_error = str(e)
-                logger.error(f"RPC call failed ({method}) on {url[:50]}...: {e}")
-                continue
+                    last_error = error
+                    launch_next()
+        finally:
+            for task in pending:
+                task.cancel()
 
         return {"error": last_error or "RPC call failed"}
 
+    async def _post_one(self, client, url: str, body: bytes, method: str) -> Tuple[object, object]:
+        """POST to one endpoint over httpx or aiohttp; returns (data, None) on success or (None, error)."""
+        try:
+            if isinstance(client, httpx.AsyncClient):
+                resp = await client.post(url, content=body, headers=_JSON_HEADERS)
+                data = orjson.loads(resp.content)
+            else:
+                async with client.post(url, data=body, headers=_JSON_HEADERS) as resp:
+                    data = orjson.loads(await resp.read())
+        except Exception as e:
+            logger.error(f"RPC call failed ({method}) on {url[:50]}...: {e}")
+            return None, str(e)
+        if isinstance(data, dict) and "error" in data:
+            error = data["error"]
+            err_code = error.get("code", 0) if isinstance(error, dict) else 0
+            if err_code == -32401:
+                logger.error(f"RPC auth failure ({method}): {error} - marking RPC as failed")
+                self.rpc_manager.mark_auth_failure(url)
+            elif err_code == -32003:
+                self.rpc_manager.mark_rate_limit(url)
+            else:
+                logger.error(f"RPC error ({method}): {error}")
+            return None, error
+        return data, None
+
+    @staticmethod
+    def _parse_sol_balance(data: dict) -> float:
+        lamports = data.get("result", {}).get("value", 0)
+        return lamports / 1e9
+
+    @staticmethod
+    def _parse_token_accounts(data: dict) -> List[Tuple[float, str, int, str]]:
+        accounts = data.get("result", {}).get("value", [])
+        rows = []
+        for acc in accounts:
+            # Direct indexing; a malformed account is skipped instead of walked through empty dicts
+            try:
+                info = acc["account"]["data"]["parsed"]["info"]
+                ta = info["tokenAmount"]
+                amount = float(ta["uiAmount"] or 0)
+            except (KeyError, TypeError):
+                continue
+            if amount > 0:
+                rows.append((amount, info.get("mint", ""), ta.get("decimals", 0), ta.get("uiAmountString", "0")))
+        return rows
+
+    @staticmethod
+    def _token_dicts(rows: List[Tuple[float, str, int, str]]) -> List[Dict]:
+        return [
+            {"mint": mint, "amount": amount, "decimals": decimals, "ui_amount": ui_amount}
+            for amount, mint, decimals, ui_amount in rows
+        ]
+
+    @staticmethod
+    def _token_accounts_params(addr: str) -> list:
+        return [addr, {"programId": TOKEN_PROGRAM_ID}, {"encoding": "jsonParsed"}]
+
     async def get_sol_balance(self, address: str = None) -> float:
         addr = address or self._address
         if not addr:
             return 0.0
         try:
             data = await self._rpc_call("getBalance", [addr])
-            lamports = data.get("result", {}).get("value", 0)
-            return lamports / 1e9
+            return self._parse_sol_balance(data)
         except Exception as e:
             logger.error(f"get_sol_balance failed: {e}")
             return 0.0
@@ -153,36 +326,41 @@ class WalletService:
         if not addr:
             return []
         try:
-            data = await self._rpc_call(
-                "getTokenAccountsByOwner",
-                [addr, {"programId": TOKEN_PROGRAM_ID}, {"encoding": "jsonParsed"}]
-            )
-            accounts = data.get("result", {}).get("value", [])
-            tokens = []
-            for acc in accounts:
-                info = acc.get("account", {}).get("data", {}).get("parsed", {}).get("info", {})
-                ta = info.get("tokenAmount", {})
-                amount = float(ta.get("uiAmount", 0) or 0)
-                if amount > 0:
-                    tokens.append({
-                        "mint": info.get("mint", ""),
-                        "amount": amount,
-                        "decimals": ta.get("decimals", 0),
-                        "ui_amount": ta.get("uiAmountString", "0"),
-                    })
-            tokens.sort(key=lambda t: t["amount"], reverse=True)
-            return tokens
+            data = await self._rpc_call("getTokenAccountsByOwner", self._token_accounts_params(addr))
+            rows = self._parse_token_accounts(data)
+            rows.sort(key=_amount_getter, reverse=True)
+            return self._token_dicts(rows)
         except Exception as e:
             logger.error(f"get_token_accounts failed: {e}")
             return []
 
     async def get_full_balance(self, address: str = None) -> Dict:
         addr = address or self._address
-        sol = await self.get_sol_balance(addr)
-        tokens = await self.get_token_accounts(addr)
+        sol = 0.0
+        rows: List[Tuple[float, str, int, str]] = []
+        if addr:
+            # One round-trip for both lookups
+            try:
+                balance_data, tokens_data = await self._rpc_batch([
+                    ("getBalance", [addr]),
+                    ("getTokenAccountsByOwner", self._token_accounts_params(addr)),
+                ])
+            except Exception as e:
+                logger.error(f"get_full_balance failed: {e}")
+            else:
+                try:
+                    sol = self._parse_sol_balance(balance_data)
+                except Exception as e:
+                    logger.error(f"get_sol_balance failed: {e}")
+                try:
+                    rows = self._parse_token_accounts(tokens_data)
+                except Exception as e:
+                    logger.error(f"get_token_accounts failed: {e}")
         return {
             "address": addr or "",
             "sol_balance": round(sol, 9),
-            "token_count": len(tokens),
-            "tokens": tokens[:50],
+            "token_count": len(rows),
+            # O(n log k) top-k instead of sorting every dust account only to drop it; keyed on the
+            # amount alone so ties keep RPC order, and only the survivors become dicts
+            "tokens": self._token_dicts(heapq.nlargest(BALANCE_TOP_TOKENS, rows, key=_amount_getter)),
         }
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import time
 import asyncio
@@ -8,6 +10,8 @@ import websockets
 import sys
 import base58
 import secrets
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from urllib.parse import urlparse
 
@@ -18,6 +22,13 @@ class HFTBotAPITester:
         self.tests_passed = 0
         self.failed_tests = []
         self.critical_issues = []
+        self._counter_lock = threading.Lock()
+        # One pooled session so each test reuses the TCP+TLS connection instead of a fresh handshake
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=20, pool_maxsize=50,
+                              max_retries=Retry(total=2, backoff_factor=0.2))
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
 
     def log(self, message, level="INFO"):
         timestamp = datetime.now().strftime("%H:%M:%S")
@@ -30,21 +41,23 @@ class HFTBotAPITester:
         if headers:
             test_headers.update(headers)
 
-        self.tests_run += 1
+        with self._counter_lock:
+            self.tests_run += 1
         self.log(f"Testing {name}...")
         
         try:
             if method == 'GET':
-                response = requests.get(url, headers=test_headers, timeout=10)
+                response = self.session.get(url, headers=test_headers, timeout=10)
             elif method == 'POST':
-                response = requests.post(url, json=data, headers=test_headers, timeout=10)
+                response = self.session.post(url, json=data, headers=test_headers, timeout=10)
             elif method == 'PUT':
-                response = requests.put(url, json=data, headers=test_headers, timeout=10)
+                response = self.session.put(url, json=data, headers=test_headers, timeout=10)
 
             success = response.status_code == expected_status
             
             if success:
-                self.tests_passed += 1
+                with self._counter_lock:
+                    self.tests_passed += 1
                 self.log(f"✅ {name} - Status: {response.status_code}", "PASS")
                 try:
                     return True, response.json()
@@ -83,6 +96,12 @@ class HFTBotAPITester:
             self.critical_issues.append(f"Connection failed for {name}: {str(e)}")
             return False, {}
 
+    def run_concurrently(self, *tests):
+        """Run independent, network-bound test methods in parallel; results come back in call order"""
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [executor.submit(test) for test in tests]
+            return [future.result() for future in futures]
+
     def test_health(self):
         """Test health endpoint"""
         success, response = self.run_test(
@@ -1115,23 +1134,25 @@ class HFTBotAPITester:
         # CRITICAL ParseService Correction Tests
         self.log("\n🔧 CRITICAL ParseService Correction Tests...")
         
-        # Test 1: Health check first
-        if not self.test_health():
+        # Tests 1-2: Health check and configuration are independent reads
+        health_ok, config, _ = self.run_concurrently(
+            self.test_health,
+            self.test_config_get,
+            self.test_configuration_buy_amount,
+        )
+        if not health_ok:
             self.log("❌ Health check failed - may indicate server issues", "ERROR")
         
-        # Test 2: Configuration
-        config = self.test_config_get()
-        self.test_configuration_buy_amount()
-        
-        # Test 3: COMPREHENSIVE ParseService test (MOST IMPORTANT)
+        # Test 3: COMPREHENSIVE ParseService test (MOST IMPORTANT) - starts/stops the bot, runs alone
         self.test_parse_service_comprehensive()
         
-        # Test 4: Additional ParseService-specific tests
-        self.test_parse_service_metrics()
-        self.test_parse_service_logs_clean()
-        
-        # Test 5: Verify API endpoints still work
-        self.test_dashboard_metrics()
+        # Tests 4-5 and 8: ParseService metrics/logs, dashboard and position endpoints (read-only)
+        self.run_concurrently(
+            self.test_parse_service_metrics,
+            self.test_parse_service_logs_clean,
+            self.test_dashboard_metrics,
+            self.test_positions_with_sell_data,
+        )
         
         # Additional Clone & Inject Tests (regression check)
         self.log("\n🔧 Clone & Inject Regression Tests...")
@@ -1142,9 +1163,6 @@ class HFTBotAPITester:
         # Test 7: _extract_pump_accounts structure for Clone & Inject
         self.test_extract_pump_accounts_structure()
         
-        # Test 8: Position endpoints with Clone & Inject data verification
-        self.test_positions_with_sell_data()
-        
         # Additional standard tests
         self.log("\n📋 Standard API Tests...")
         
@@ -1194,8 +1212,7 @@ class HFTBotAPITester:
         
         # Additional bot tests
         self.log("\n🤖 Additional Bot Tests...")
-        bot_status = self.test_bot_status()
-        self.test_logs()
+        bot_status, _ = self.run_concurrently(self.test_bot_status, self.test_logs)
         
         # Control operations
         self.test_bot_control()
@@ -1335,6 +1352,8 @@ def main():
     except Exception as e:
         tester.log(f"\n💥 Test suite crashed: {str(e)}", "ERROR")
         return 3
+    finally:
+        tester.session.close()
     
     return tester.print_summary()
 
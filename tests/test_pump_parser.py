@@ -0,0 +1,433 @@
+"""Golden tests: services._pump_parser must match the original in-class parser output.
+
+_reference_extract is the SolanaTrader._extract_pump_accounts body as it stood before the
+parser moved to services/_pump_parser.py (logging dropped), kept verbatim as the oracle.
+"""
+import copy
+import hashlib
+import sys
+from pathlib import Path
+
+import base58
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "backend"))
+
+from services._pump_parser import extract_pump_accounts  # noqa: E402
+
+TOKEN_PROGRAM_STR = "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA"
+TOKEN_2022_PROGRAM_STR = "TokenzQdBNbLqP5VEhdkAS6EPFLC1PHnBqCXEpPxuEb"
+PUMP_FUN_PROGRAM = "6EF8rrecthR5Dkzon8Nwu78hRvfCKubJ14M5uBEwF6P"
+SYSTEM_PROGRAM = "11111111111111111111111111111111"
+ATA_PROGRAM = "ATokenGPvbdGVxr1b2hvZbsiqW5xWH25efTNsLJA8knL"
+MPL_TOKEN_METADATA = "metaqbxxUerdq28cj1RbAWkYQm3ybzjb6a8bt518x1s"
+RENT_SYSVAR = "SysvarRent111111111111111111111111111111111"
+COMPUTE_BUDGET = "ComputeBudget111111111111111111111111111111"
+PUMP_GLOBAL = "4wTV1YmiEkRvAtNtsSGPtUrqRYQMe5SKy2uB4Jjaxnjf"
+PUMP_EVENT_AUTHORITY = "Ce6TQqeHC71KxtCGD5NbJ2oH1rjhs3v5YbcSj7CMqhg1"
+
+
+def _reference_extract(tx_data):
+    try:
+        meta = tx_data.get("meta")
+        if meta is None:
+            return None, "tx_meta_null"
+        if meta.get("err"):
+            return None, "tx_meta_err"
+
+        tx_msg = tx_data.get("transaction", {}).get("message", {})
+        account_keys = tx_msg.get("accountKeys", [])
+        if not account_keys:
+            return None, "no_account_keys"
+
+        keys_list = []
+        for ak in account_keys:
+            if isinstance(ak, dict):
+                keys_list.append(ak.get("pubkey", ""))
+            else:
+                keys_list.append(str(ak))
+
+        logs = meta.get("logMessages", [])
+        if not any("Instruction: Create" in line or "InitializeMint" in line for line in logs):
+            return None, "no_create_discriminator"
+
+        token_program_str = TOKEN_2022_PROGRAM_STR
+        if TOKEN_PROGRAM_STR in keys_list and TOKEN_2022_PROGRAM_STR not in keys_list:
+            token_program_str = TOKEN_PROGRAM_STR
+
+        instructions = tx_msg.get("instructions", [])
+        pump_ix = None
+        for ix in instructions:
+            prog = ix.get("programId", "")
+            if prog == str(PUMP_FUN_PROGRAM):
+                pump_ix = ix
+                break
+
+        if not pump_ix:
+            inner = meta.get("innerInstructions", [])
+            for inner_group in inner:
+                for ix in inner_group.get("instructions", []):
+                    if ix.get("programId", "") == str(PUMP_FUN_PROGRAM):
+                        pump_ix = ix
+                        break
+
+        if not pump_ix:
+            return None, "no_pump_instruction"
+
+        ix_accounts = pump_ix.get("accounts", [])
+        post_balances = meta.get("postTokenBalances", [])
+        if not post_balances:
+            return None, "no_post_token_balances"
+
+        mint = None
+        bonding_curve = None
+        assoc_bonding_curve = None
+
+        for ptb in post_balances:
+            m = ptb.get("mint", "")
+            owner = ptb.get("owner", "")
+            if m and owner:
+                mint = m
+                break
+
+        if len(ix_accounts) >= 5:
+            if not mint:
+                mint = ix_accounts[2] if len(ix_accounts) > 2 else None
+            bonding_curve = ix_accounts[3] if len(ix_accounts) > 3 else None
+            assoc_bonding_curve = ix_accounts[4] if len(ix_accounts) > 4 else None
+
+        if mint and bonding_curve:
+            creator = None
+            for k in keys_list:
+                ak_entry = None
+                for raw_ak in account_keys:
+                    pk = raw_ak.get("pubkey", "") if isinstance(raw_ak, dict) else str(raw_ak)
+                    if pk == k:
+                        ak_entry = raw_ak
+                        break
+                if isinstance(ak_entry, dict) and ak_entry.get("signer") and k != mint:
+                    creator = k
+                    break
+
+            account_metas_for_clone = []
+            for idx in ix_accounts:
+                pubkey_str = ""
+                is_signer = False
+                is_writable = False
+
+                if isinstance(idx, int):
+                    if idx < len(account_keys):
+                        ak = account_keys[idx]
+                        pubkey_str = ak.get("pubkey", "") if isinstance(ak, dict) else str(ak)
+                        is_signer = ak.get("signer", False) if isinstance(ak, dict) else False
+                        is_writable = ak.get("writable", False) if isinstance(ak, dict) else False
+                elif isinstance(idx, dict):
+                    pubkey_str = idx.get("pubkey", "")
+                    is_signer = idx.get("signer", False)
+                    is_writable = idx.get("writable", False)
+                else:
+                    pubkey_str = str(idx)
+                    for ak in account_keys:
+                        ak_pubkey = ak.get("pubkey", "") if isinstance(ak, dict) else str(ak)
+                        if ak_pubkey == pubkey_str:
+                            if isinstance(ak, dict):
+                                is_signer = ak.get("signer", False)
+                                is_writable = ak.get("writable", False)
+                            break
+
+                if pubkey_str:
+                    account_metas_for_clone.append({
+                        "pubkey": pubkey_str,
+                        "isSigner": is_signer,
+                        "isWritable": is_writable
+                    })
+
+            if not account_metas_for_clone:
+                return None, "clone_accounts_empty"
+
+            return {
+                "mint": mint,
+                "bonding_curve": bonding_curve,
+                "associated_bonding_curve": assoc_bonding_curve or "",
+                "token_program": token_program_str,
+                "creator": creator,
+                "accounts": ix_accounts,
+                "all_keys": keys_list,
+                "instruction_data": pump_ix.get("data", ""),
+                "account_metas_clone": account_metas_for_clone,
+            }, None
+        return None, "missing_accounts"
+
+    except Exception:
+        return None, "extract_exception"
+
+
+def _pubkey(label):
+    return base58.b58encode(hashlib.sha256(label.encode()).digest()).decode()
+
+
+USER = _pubkey("user")
+MINT = _pubkey("mint")
+BONDING_CURVE = _pubkey("bonding_curve")
+ASSOC_BONDING_CURVE = _pubkey("associated_bonding_curve")
+METADATA = _pubkey("metadata")
+USER_ATA = _pubkey("user_ata")
+ROUTER = _pubkey("router_program")
+
+
+def _create_tx(token_program=TOKEN_PROGRAM_STR, with_buy=True):
+    """jsonParsed getTransaction result for a pump.fun create (+ dev buy), in the RPC's layout."""
+    account_keys = [
+        {"pubkey": USER, "signer": True, "writable": True, "source": "transaction"},
+        {"pubkey": MINT, "signer": True, "writable": True, "source": "transaction"},
+        {"pubkey": BONDING_CURVE, "signer": False, "writable": True, "source": "transaction"},
+        {"pubkey": ASSOC_BONDING_CURVE, "signer": False, "writable": True, "source": "transaction"},
+        {"pubkey": METADATA, "signer": False, "writable": True, "source": "transaction"},
+        {"pubkey": USER_ATA, "signer": False, "writable": True, "source": "transaction"},
+        {"pubkey": SYSTEM_PROGRAM, "signer": False, "writable": False, "source": "transaction"},
+        {"pubkey": token_program, "signer": False, "writable": False, "source": "transaction"},
+        {"pubkey": ATA_PROGRAM, "signer": False, "writable": False, "source": "transaction"},
+        {"pubkey": MPL_TOKEN_METADATA, "signer": False, "writable": False, "source": "transaction"},
+        {"pubkey": RENT_SYSVAR, "signer": False, "writable": False, "source": "transaction"},
+        {"pubkey": PUMP_GLOBAL, "signer": False, "writable": False, "source": "transaction"},
+        {"pubkey": PUMP_EVENT_AUTHORITY, "signer": False, "writable": False, "source": "transaction"},
+        {"pubkey": PUMP_FUN_PROGRAM, "signer": False, "writable": False, "source": "transaction"},
+        {"pubkey": COMPUTE_BUDGET, "signer": False, "writable": False, "source": "transaction"},
+    ]
+    create_ix = {
+        "programId": PUMP_FUN_PROGRAM,
+        "accounts": [
+            MINT, _pubkey("mint_authority"), BONDING_CURVE, ASSOC_BONDING_CURVE, PUMP_GLOBAL,
+            MPL_TOKEN_METADATA, METADATA, USER, SYSTEM_PROGRAM, token_program, ATA_PROGRAM,
+            RENT_SYSVAR, PUMP_EVENT_AUTHORITY, PUMP_FUN_PROGRAM,
+        ],
+        "data": "2ZrHs1z2JHBYkN7s8rXKSf9hVfYo7BN3Xe6B2hVr7mTnSWPbHDLGW",
+        "stackHeight": None,
+    }
+    instructions = [
+        {"programId": COMPUTE_BUDGET, "accounts": [], "data": "3sH6nDG1BuRf", "stackHeight": None},
+        create_ix,
+    ]
+    logs = [
+        f"Program {COMPUTE_BUDGET} invoke [1]",
+        f"Program {COMPUTE_BUDGET} success",
+        f"Program {PUMP_FUN_PROGRAM} invoke [1]",
+        "Program log: Instruction: Create",
+        f"Program {SYSTEM_PROGRAM} invoke [2]",
+        f"Program {SYSTEM_PROGRAM} success",
+        f"Program {token_program} invoke [2]",
+        "Program log: Instruction: InitializeMint2",
+        f"Program {token_program} consumed 2780 of 234959 compute units",
+        f"Program {token_program} success",
+        f"Program {PUMP_FUN_PROGRAM} consumed 118633 of 349850 compute units",
+        f"Program {PUMP_FUN_PROGRAM} success",
+    ]
+    post_balances = [
+        {"accountIndex": 3, "mint": MINT, "owner": BONDING_CURVE, "programId": token_program,
+         "uiTokenAmount": {"amount": "1000000000000000", "decimals": 6,
+                           "uiAmount": 1000000000.0, "uiAmountString": "1000000000"}},
+    ]
+    if with_buy:
+        instructions.append({
+            "programId": PUMP_FUN_PROGRAM,
+            "accounts": [
+                PUMP_GLOBAL, _pubkey("fee_recipient"), MINT, BONDING_CURVE, ASSOC_BONDING_CURVE,
+                USER_ATA, USER, SYSTEM_PROGRAM, token_program, RENT_SYSVAR,
+                PUMP_EVENT_AUTHORITY, PUMP_FUN_PROGRAM,
+            ],
+            "data": "AJTQ2h9DXrBmWa1b8uuJm9nn3HtGtrNM",
+            "stackHeight": None,
+        })
+        logs += [
+            f"Program {PUMP_FUN_PROGRAM} invoke [1]",
+            "Program log: Instruction: Buy",
+            f"Program {PUMP_FUN_PROGRAM} success",
+        ]
+        post_balances.insert(0, {
+            "accountIndex": 5, "mint": MINT, "owner": USER, "programId": token_program,
+            "uiTokenAmount": {"amount": "35000000000000", "decimals": 6,
+                              "uiAmount": 35000000.0, "uiAmountString": "35000000"}})
+    return {
+        "slot": 301234567,
+        "blockTime": 1733000000,
+        "meta": {
+            "err": None,
+            "fee": 105000,
+            "innerInstructions": [],
+            "logMessages": logs,
+            "postTokenBalances": post_balances,
+            "preTokenBalances": [],
+        },
+        "transaction": {
+            "message": {"accountKeys": account_keys, "instructions": instructions},
+            "signatures": [base58.b58encode(hashlib.sha512(b"sig").digest()).decode()],
+        },
+    }
+
+
+def _buy_tx():
+    tx = _create_tx(with_buy=True)
+    msg = tx["transaction"]["message"]
+    msg["instructions"] = [ix for ix in msg["instructions"] if ix["data"].startswith("AJT")]
+    tx["meta"]["logMessages"] = [
+        f"Program {PUMP_FUN_PROGRAM} invoke [1]",
+        "Program log: Instruction: Buy",
+        f"Program {PUMP_FUN_PROGRAM} success",
+    ]
+    return tx
+
+
+def _routed_create_tx():
+    """Create issued through another program: the pump ix only appears in innerInstructions."""
+    tx = _create_tx(with_buy=False)
+    msg = tx["transaction"]["message"]
+    pump_ix = msg["instructions"].pop()
+    msg["instructions"].append({"programId": ROUTER, "accounts": [USER, MINT], "data": "3Bxs4h24hBtQy9rw"})
+    tx["meta"]["innerInstructions"] = [
+        {"index": 0, "instructions": []},
+        {"index": 1, "instructions": [dict(pump_ix, stackHeight=2)]},
+    ]
+    return tx
+
+
+def _routed_create_and_buy_tx():
+    """Router CPIs into pump.fun from two top-level instructions: create, then the dev buy."""
+    tx = _create_tx(with_buy=True)
+    msg = tx["transaction"]["message"]
+    buy_ix = msg["instructions"].pop()
+    create_ix = msg["instructions"].pop()
+    msg["instructions"] += [
+        {"programId": ROUTER, "accounts": [USER, MINT], "data": "3Bxs4h24hBtQy9rw"},
+        {"programId": ROUTER, "accounts": [USER, MINT], "data": "3Bxs4h24hBtQy9rx"},
+    ]
+    tx["meta"]["innerInstructions"] = [
+        {"index": 1, "instructions": [dict(create_ix, stackHeight=2)]},
+        {"index": 2, "instructions": [dict(buy_ix, stackHeight=2)]},
+    ]
+    return tx
+
+
+def _index_accounts_tx():
+    """Instruction accounts given as indices into accountKeys."""
+    tx = _create_tx(with_buy=False)
+    msg = tx["transaction"]["message"]
+    keys = [ak["pubkey"] for ak in msg["accountKeys"]]
+    pump_ix = msg["instructions"][-1]
+    pump_ix["accounts"] = [keys.index(a) if a in keys else 99 for a in pump_ix["accounts"]]
+    return tx
+
+
+def _string_keys_tx():
+    tx = _create_tx(with_buy=False)
+    msg = tx["transaction"]["message"]
+    msg["accountKeys"] = [ak["pubkey"] for ak in msg["accountKeys"]]
+    return tx
+
+
+def _variant(base, mutate):
+    tx = copy.deepcopy(base)
+    mutate(tx)
+    return tx
+
+
+FIXTURES = {
+    "create_spl": _create_tx(TOKEN_PROGRAM_STR),
+    "create_token2022": _create_tx(TOKEN_2022_PROGRAM_STR),
+    "create_without_dev_buy": _create_tx(with_buy=False),
+    "buy_only": _buy_tx(),
+    "routed_create": _routed_create_tx(),
+    "routed_create_and_buy": _routed_create_and_buy_tx(),
+    "index_accounts": _index_accounts_tx(),
+    "string_account_keys": _string_keys_tx(),
+    "meta_null": _variant(_create_tx(), lambda tx: tx.update(meta=None)),
+    "meta_err": _variant(_create_tx(), lambda tx: tx["meta"].update(err={"InstructionError": [1, {"Custom": 6001}]})),
+    "no_account_keys": _variant(_create_tx(), lambda tx: tx["transaction"]["message"].update(accountKeys=[])),
+    "no_post_balances": _variant(_create_tx(), lambda tx: tx["meta"].update(postTokenBalances=[])),
+    "mint_from_ix_accounts": _variant(
+        _create_tx(), lambda tx: [b.pop("owner") for b in tx["meta"]["postTokenBalances"]]
+    ),
+    "short_ix_accounts": _variant(
+        _create_tx(with_buy=False),
+        lambda tx: tx["transaction"]["message"]["instructions"][-1].update(accounts=[MINT, USER, BONDING_CURVE]),
+    ),
+    "inner_instructions_null": _variant(
+        _routed_create_tx(), lambda tx: tx["meta"].update(innerInstructions=None)
+    ),
+    "no_pump_ix": _variant(
+        _create_tx(with_buy=False),
+        lambda tx: tx["transaction"]["message"]["instructions"].pop(),
+    ),
+}
+
+
+@pytest.mark.parametrize("name", sorted(FIXTURES))
+def test_matches_reference_parser(name):
+    tx = FIXTURES[name]
+    assert extract_pump_accounts(copy.deepcopy(tx)) == _reference_extract(copy.deepcopy(tx))
+
+
+def test_create_fields():
+    parsed, reason = extract_pump_accounts(FIXTURES["create_spl"])
+    assert reason is None
+    assert parsed["mint"] == MINT
+    assert parsed["token_program"] == TOKEN_PROGRAM_STR
+    assert parsed["creator"] == USER
+    assert len(parsed["account_metas_clone"]) == 14
+
+
+def _as_base64(tx):
+    """Re-encode a jsonParsed fixture the way getTransaction returns it with encoding=base64."""
+    import base64
+
+    from solders.hash import Hash
+    from solders.instruction import CompiledInstruction
+    from solders.message import Message
+    from solders.pubkey import Pubkey
+    from solders.signature import Signature
+    from solders.transaction import Transaction
+
+    tx = copy.deepcopy(tx)
+    msg = tx["transaction"]["message"]
+    keys = [ak["pubkey"] for ak in msg["accountKeys"]]
+    # Hand-built fixtures name some programs/accounts only inside instructions; a real message lists them all
+    inner_ixs = [ix for group in tx["meta"]["innerInstructions"] for ix in group["instructions"]]
+    for ix in msg["instructions"] + inner_ixs:
+        for key in [ix["programId"], *ix["accounts"]]:
+            if key not in keys:
+                keys.append(key)
+                msg["accountKeys"].append({"pubkey": key, "signer": False, "writable": False})
+
+    def compiled(ix):
+        return CompiledInstruction(keys.index(ix["programId"]), base58.b58decode(ix["data"]),
+                                   bytes(keys.index(a) for a in ix["accounts"]))
+
+    n_signers = sum(ak["signer"] for ak in msg["accountKeys"])
+    n_readonly = sum(not ak["writable"] for ak in msg["accountKeys"])
+    message = Message.new_with_compiled_instructions(
+        n_signers, 0, n_readonly, [Pubkey.from_string(k) for k in keys], Hash.default(),
+        [compiled(ix) for ix in msg["instructions"]],
+    )
+    raw = bytes(Transaction.populate(message, [Signature.default()] * n_signers))
+    meta = dict(tx["meta"])
+    meta["innerInstructions"] = [
+        {"index": group["index"], "instructions": [
+            {"programIdIndex": keys.index(ix["programId"]), "accounts": [keys.index(a) for a in ix["accounts"]],
+             "data": ix["data"], "stackHeight": 2}
+            for ix in group["instructions"]
+        ]}
+        for group in meta["innerInstructions"]
+    ]
+    return tx, {**tx, "meta": meta, "transaction": [base64.b64encode(raw).decode(), "base64"]}
+
+
+def test_base64_decode_picks_last_routed_group():
+    pytest.importorskip("solders")
+    from services.solana_trader import _decode_base64_tx
+
+    parsed_tx, b64_tx = _as_base64(FIXTURES["routed_create_and_buy"])
+    decoded = _decode_base64_tx(b64_tx)
+
+    (group,) = decoded["meta"]["innerInstructions"]
+    assert group["index"] == 2
+    assert group["instructions"][0]["data"] == parsed_tx["meta"]["innerInstructions"][1]["instructions"][0]["data"]
+    assert extract_pump_accounts(decoded) == _reference_extract(parsed_tx)
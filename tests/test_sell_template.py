@@ -0,0 +1,63 @@
+"""A sell re-signed from the cached message template must be byte-identical to a fresh build."""
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("solders")
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "backend"))
+
+from solders.hash import Hash  # noqa: E402
+from solders.keypair import Keypair  # noqa: E402
+
+from services.solana_trader import SolanaTrader  # noqa: E402
+
+MINT = str(Keypair.from_seed(bytes([1]) * 32).pubkey())
+BONDING_CURVE = str(Keypair.from_seed(bytes([2]) * 32).pubkey())
+ASSOC_BONDING_CURVE = str(Keypair.from_seed(bytes([3]) * 32).pubkey())
+CREATOR = str(Keypair.from_seed(bytes([4]) * 32).pubkey())
+TIP_ACCOUNT = str(Keypair.from_seed(bytes([5]) * 32).pubkey())
+
+
+def _blockhash_ctx(seed: int):
+    return {"blockhash": str(Hash(bytes([seed]) * 32)), "last_valid_block_height": 1}
+
+
+def _trader(tip_account: str = "") -> SolanaTrader:
+    trader = SolanaTrader(None, None)
+    trader.jito_tip_account = tip_account
+    trader.load_keypair(bytes(range(32)))
+    return trader
+
+
+def _sell(trader, token_amount, blockhash_ctx, slippage_pct=25.0):
+    return asyncio.run(trader.build_sell_transaction(
+        MINT, BONDING_CURVE, ASSOC_BONDING_CURVE, token_amount, slippage_pct,
+        blockhash_ctx, creator_str=CREATOR,
+    ))
+
+
+@pytest.mark.parametrize("tip_account", ["", TIP_ACCOUNT])
+def test_template_sell_matches_fresh_build(tip_account):
+    trader = _trader(tip_account)
+    ctx = _blockhash_ctx(7)
+    _sell(trader, 1_000_000, ctx)
+    assert len(trader._sell_templates) == 1
+
+    # Same position and blockhash, new amounts: served from the template
+    from_template = _sell(trader, 2_345_678, ctx, slippage_pct=10.0)["tx_bytes"]
+    fresh = _sell(_trader(tip_account), 2_345_678, ctx, slippage_pct=10.0)["tx_bytes"]
+    assert from_template == fresh
+
+
+def test_blockhash_change_drops_template():
+    trader = _trader()
+    _sell(trader, 1_000_000, _blockhash_ctx(7))
+    next_hash = _blockhash_ctx(8)
+    rebuilt = _sell(trader, 1_000_000, next_hash)["tx_bytes"]
+
+    blockhash, _, _ = next(iter(trader._sell_templates.values()))
+    assert blockhash == bytes([8]) * 32
+    assert rebuilt == _sell(_trader(), 1_000_000, next_hash)["tx_bytes"]